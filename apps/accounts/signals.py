@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Account
+from eta_api.utils.cache import invalidate_user_cache
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_cache(sender, instance, **kwargs):
+    """Drop the user's cached account list whenever an account (or its balance) changes"""
+    invalidate_user_cache(instance.user_id, "accounts")
@@ -1,13 +1,18 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.exceptions import ValidationError
+from django.conf import settings
 from .models import Account
 from .serializers import AccountSerializer
+from eta_api.mixins import BulkCreateMixin
 from eta_api.utils.responses import success_response, error_response
+from eta_api.utils.serializers import format_decimals
+from eta_api.utils.cache import get_or_set_for_user, invalidate_user_cache
 
 
-class AccountViewSet(viewsets.ModelViewSet):
+class AccountViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     serializer_class = AccountSerializer
     permission_classes = [permissions.IsAuthenticated]
+    bulk_create_message = "Accounts created successfully"
 
     def get_queryset(self):
         return Account.objects.filter(user=self.request.user)
@@ -15,11 +20,25 @@ class AccountViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def perform_bulk_create(self, objects):
+        # bulk_create skips post_save, so invalidate the cached list here
+        objects = super().perform_bulk_create(objects)
+        invalidate_user_cache(self.request.user.pk, "accounts")
+        return objects
+
     # GET /accounts/
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
+        # Read-only fast path: plain rows instead of serializer instances,
+        # cached per user until an account changes (see signals.py)
+        data = get_or_set_for_user(
+            "accounts",
+            request.user.pk,
+            lambda: format_decimals(
+                self.get_queryset().values(*AccountSerializer.Meta.fields), ["balance"]
+            ),
+            settings.LIST_CACHE_TTL,
+        )
+        return success_response(data)
 
     # GET /accounts/{id}/
     def retrieve(self, request, *args, **kwargs):
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.budgets.models import Budget
+from apps.transactions.signals import recalculate_budget_expenses
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Budget.current_expense from transactions. Transaction signals "
+        "apply deltas; run this to reconcile after imports or manual data fixes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            help='Only recalculate budgets of the user with this email',
+        )
+
+    def handle(self, *args, **options):
+        budgets = Budget.objects.all()
+        if options['user']:
+            budgets = budgets.filter(user__email=options['user'])
+
+        recalculate_budget_expenses(budgets)
+
+        self.stdout.write(self.style.SUCCESS(f"Recalculated {budgets.count()} budgets"))
@@ -18,6 +18,12 @@ class Budget(models.Model):
     end_date = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="budget_user_created_idx"),
+            models.Index(fields=["user", "start_date", "end_date"], name="budget_user_period_idx"),
+        ]
+
     def __str__(self):
         return f"Budget {self.category.name} - {self.amount}"
 
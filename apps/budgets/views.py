@@ -1,12 +1,17 @@
 from rest_framework import viewsets, permissions, status
+from django.db.models import F
 from .models import Budget
 from .serializers import BudgetSerializer
+from eta_api.mixins import BulkCreateMixin
 from eta_api.utils.responses import success_response, error_response
+from eta_api.utils.serializers import format_decimals
+from apps.transactions.signals import recalculate_budget_expenses
 
 
-class BudgetViewSet(viewsets.ModelViewSet):
+class BudgetViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     serializer_class = BudgetSerializer
     permission_classes = [permissions.IsAuthenticated]
+    bulk_create_message = "Budgets created successfully"
 
     def get_queryset(self):
         # Only budgets for logged-in user
@@ -16,11 +21,24 @@ class BudgetViewSet(viewsets.ModelViewSet):
         # Attach logged-in user automatically
         serializer.save(user=self.request.user)
 
+    def perform_bulk_create(self, objects):
+        budgets = Budget.objects.filter(
+            pk__in=[b.pk for b in super().perform_bulk_create(objects)]
+        )
+        # bulk_create skips the post_save handler that computes current_expense
+        recalculate_budget_expenses(budgets)
+        return list(budgets.order_by("id"))
+
     # 👇 Override CRUD methods with custom responses
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
+        # Read-only fast path: plain rows, with remaining computed in SQL
+        rows = self.get_queryset().values(
+            *(f for f in BudgetSerializer.Meta.fields if f != "remaining"),
+            remaining=F("amount") - F("current_expense"),
+        )
+        return success_response(
+            format_decimals(rows, ["amount", "current_expense", "remaining"])
+        )
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
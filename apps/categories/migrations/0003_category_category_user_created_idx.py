@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_category_colorhex_category_icon'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', '-created_at'], name='category_user_created_idx'),
+        ),
+    ]
@@ -17,5 +17,10 @@ class Category(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="category_user_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.type})"
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Category
+from eta_api.utils.cache import invalidate_user_cache
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, instance, **kwargs):
+    """Drop the user's cached category list whenever a category changes"""
+    invalidate_user_cache(instance.user_id, "categories")
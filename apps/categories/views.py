@@ -1,15 +1,19 @@
 from rest_framework import viewsets, permissions, status
+from django.conf import settings
 from .models import Category
 from .serializers import CategorySerializer
+from eta_api.mixins import BulkCreateMixin
+from eta_api.utils.cache import get_or_set_for_user, invalidate_user_cache
 from eta_api.utils.responses import (
     success_response,
     error_response,
 )  # 👈 import helpers
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticated]
+    bulk_create_message = "Categories created successfully"
 
     def get_queryset(self):
         # Only return categories belonging to the logged-in user
@@ -19,11 +23,23 @@ class CategoryViewSet(viewsets.ModelViewSet):
         # Attach the logged-in user automatically
         serializer.save(user=self.request.user)
 
+    def perform_bulk_create(self, objects):
+        # bulk_create skips post_save, so invalidate the cached list here
+        objects = super().perform_bulk_create(objects)
+        invalidate_user_cache(self.request.user.pk, "categories")
+        return objects
+
     # 👇 Override list, retrieve, create, update, destroy to use your helper
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
+        # Read-only fast path: plain rows instead of serializer instances,
+        # cached per user until a category changes (see signals.py)
+        data = get_or_set_for_user(
+            "categories",
+            request.user.pk,
+            lambda: list(self.get_queryset().values(*CategorySerializer.Meta.fields)),
+            settings.LIST_CACHE_TTL,
+        )
+        return success_response(data)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -1,5 +1,4 @@
 from uuid import UUID
-from apps.users.models import User
 from langchain.tools import tool
 from .tools import (
     get_total_expense_this_month,
@@ -13,77 +12,67 @@ from .tools import (
     get_top_spending_category,
 )
 
+# Characters the LLM tends to wrap around the user id
+_STRIP_TABLE = str.maketrans("", "", "'\".")
+
+
+def _parse_user_id(user_id):
+    """Clean the user id passed by the agent; the tools filter on it directly."""
+    return UUID(user_id.strip().translate(_STRIP_TABLE))
+
 
 @tool
 def expense_tool(user_id: str) -> str:
     """Use this to get the user's total expense for the current month."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_total_expense_this_month(user)
+    return get_total_expense_this_month(_parse_user_id(user_id))
 
 
 @tool
 def income_tool(user_id: str) -> str:
     """Use this to get the user's total income for the current month."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_total_income_this_month(user)
+    return get_total_income_this_month(_parse_user_id(user_id))
 
 
 @tool
 def category_breakdown_tool(user_id: str) -> str:
     """Use this to get a breakdown of expenses by category for the current month."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_category_breakdown(user)
+    return get_category_breakdown(_parse_user_id(user_id))
 
 
 @tool
 def biggest_expense_tool(user_id: str) -> str:
     """Use this to find the user's largest single expense for the current month."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_biggest_expense(user)
+    return get_biggest_expense(_parse_user_id(user_id))
 
 
 @tool
 def budget_status_tool(user_id: str) -> str:
     """Use this to check the status of all active budgets and see if the user is over or under budget."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_budget_status(user)
+    return get_budget_status(_parse_user_id(user_id))
 
 
 @tool
 def recent_transactions_tool(user_id: str) -> str:
     """Use this to get the user's 10 most recent transactions."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_recent_transactions(user)
+    return get_recent_transactions(_parse_user_id(user_id))
 
 
 @tool
 def account_balances_tool(user_id: str) -> str:
     """Use this to get the current balance of all user's accounts and the total."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_account_balances(user)
+    return get_account_balances(_parse_user_id(user_id))
 
 
 @tool
 def spending_trends_tool(user_id: str) -> str:
     """Use this to compare current month spending with last month and identify trends."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_spending_trends(user)
+    return get_spending_trends(_parse_user_id(user_id))
 
 
 @tool
 def top_spending_category_tool(user_id: str) -> str:
     """Use this to find which category the user spent the most money on this month."""
-    clean_id = user_id.strip().replace("'", "").replace('"', "").replace(".", "")
-    user = User.objects.get(id=UUID(clean_id))
-    return get_top_spending_category(user)
+    return get_top_spending_category(_parse_user_id(user_id))
 
 
 tools = [
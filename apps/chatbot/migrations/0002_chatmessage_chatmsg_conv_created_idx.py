@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['conversation', '-created_at'], name='chatmsg_conv_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0002_chatmessage_chatmsg_conv_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='chatmessage',
+            options={'ordering': ['created_at', 'id']},
+        ),
+    ]
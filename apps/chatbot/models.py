@@ -38,7 +38,10 @@ class ChatMessage(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['created_at']
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['conversation', '-created_at'], name='chatmsg_conv_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.role}: {self.content[:50]}..."
@@ -1,14 +1,37 @@
+import json
+
 import requests
 
 OLLAMA_URL = "http://host.docker.internal:11434/api/generate"  # works inside docker
 
+# (connect, read) timeouts in seconds
+OLLAMA_TIMEOUT = (3, 120)
+
+# Reuse one keep-alive connection pool across calls
+_session = requests.Session()
+
 
 # Direct Run: http://localhost:11434
 
 
 def query_ollama(prompt: str, model: str = "llama3.2") -> str:
     payload = {"model": model, "prompt": prompt, "stream": False}
-    response = requests.post(OLLAMA_URL, json=payload)
+    response = _session.post(OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT)
     response.raise_for_status()
     data = response.json()
     return data.get("response", "")
+
+
+def stream_ollama(prompt: str, model: str = "llama3.2"):
+    """Yield response text chunks as Ollama generates them"""
+    payload = {"model": model, "prompt": prompt, "stream": True}
+    with _session.post(OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get("response"):
+                yield chunk["response"]
+            if chunk.get("done"):
+                break
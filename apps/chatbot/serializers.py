@@ -19,6 +19,9 @@ class ConversationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
     def get_message_count(self, obj):
+        # Count the prefetched messages instead of issuing a COUNT query
+        if 'messages' in getattr(obj, '_prefetched_objects_cache', {}):
+            return len(obj.messages.all())
         return obj.messages.count()
 
 
@@ -33,10 +36,17 @@ class ConversationListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
     def get_message_count(self, obj):
+        # Annotated by conversation_list_view; fall back to a COUNT query otherwise
+        if hasattr(obj, 'message_count'):
+            return obj.message_count
         return obj.messages.count()
 
     def get_last_message(self, obj):
-        last_msg = obj.messages.last()
+        # Prefetched by conversation_list_view; fall back to a query otherwise
+        if hasattr(obj, 'latest_messages'):
+            last_msg = obj.latest_messages[0] if obj.latest_messages else None
+        else:
+            last_msg = obj.messages.last()
         if last_msg:
             return {
                 'role': last_msg.role,
@@ -2,35 +2,70 @@ from apps.transactions.models import Transaction
 from apps.budgets.models import Budget
 from apps.accounts.models import Account
 from django.utils.timezone import now
-from django.db.models import Sum, Count
+from django.db.models import Sum, Count, Q
 from decimal import Decimal
+from eta_api.utils.cache import get_or_set_for_user
+from eta_api.utils.dates import add_months
 
+# Seconds the monthly totals are reused across tool calls
+MONTHLY_DASHBOARD_TTL = 60
 
-def get_total_expense_this_month(user):
-    """Get total expenses for current month"""
+
+def _month_bounds(today):
+    """Return the first day of last month, this month and next month"""
+    first_of_month = today.date().replace(day=1)
+    return add_months(first_of_month, -1), first_of_month, add_months(first_of_month, 1)
+
+
+def _compute_monthly_dashboard(user_id, today):
+    first_of_last_month, first_of_month, first_of_next_month = _month_bounds(today)
+    current_month = Q(date__gte=first_of_month)
+
+    totals = Transaction.objects.filter(
+        user_id=user_id,
+        date__gte=first_of_last_month,
+        date__lt=first_of_next_month,
+    ).aggregate(
+        current_expense=Sum('amount', filter=current_month & Q(type="expense")),
+        current_income=Sum('amount', filter=current_month & Q(type="income")),
+        last_expense=Sum('amount', filter=Q(date__lt=first_of_month, type="expense")),
+    )
+    return {key: value or Decimal('0') for key, value in totals.items()}
+
+
+def get_monthly_dashboard(user_id):
+    """
+    Get current-month and last-month totals in a single query.
+    Cached in the user's "summary" namespace, so several tools called in one
+    chat turn share the result and apps.dashboard.signals drops it on every
+    write to the user's transactions, budgets or accounts.
+    """
     today = now()
-    qs = Transaction.objects.filter(
-        user=user, type="expense", date__year=today.year, date__month=today.month
+    return get_or_set_for_user(
+        "summary", user_id, lambda: _compute_monthly_dashboard(user_id, today),
+        MONTHLY_DASHBOARD_TTL, "chatbot-monthly", today.date()
     )
-    total = qs.aggregate(Sum("amount"))["amount__sum"] or Decimal('0')
+
+
+def get_total_expense_this_month(user_id):
+    """Get total expenses for current month"""
+    today = now()
+    total = get_monthly_dashboard(user_id)['current_expense']
     return f"Your total expenses for {today.strftime('%B %Y')} are ${total}."
 
 
-def get_total_income_this_month(user):
+def get_total_income_this_month(user_id):
     """Get total income for current month"""
     today = now()
-    qs = Transaction.objects.filter(
-        user=user, type="income", date__year=today.year, date__month=today.month
-    )
-    total = qs.aggregate(Sum("amount"))["amount__sum"] or Decimal('0')
+    total = get_monthly_dashboard(user_id)['current_income']
     return f"Your total income for {today.strftime('%B %Y')} is ${total}."
 
 
-def get_category_breakdown(user):
+def get_category_breakdown(user_id):
     """Get expense breakdown by category for current month"""
     today = now()
     breakdown = Transaction.objects.filter(
-        user=user,
+        user_id=user_id,
         type="expense",
         date__year=today.year,
         date__month=today.month
@@ -42,23 +77,23 @@ def get_category_breakdown(user):
     if not breakdown:
         return "You have no expenses this month yet."
 
-    result = f"Expense breakdown for {today.strftime('%B %Y')}:\n"
+    parts = [f"Expense breakdown for {today.strftime('%B %Y')}:\n"]
     for item in breakdown:
         category = item['category__name'] or 'Uncategorized'
-        result += f"- {category}: ${item['total']} ({item['count']} transactions)\n"
+        parts.append(f"- {category}: ${item['total']} ({item['count']} transactions)\n")
 
-    return result
+    return "".join(parts)
 
 
-def get_biggest_expense(user):
+def get_biggest_expense(user_id):
     """Get the largest expense transaction for current month"""
     today = now()
     transaction = Transaction.objects.filter(
-        user=user,
+        user_id=user_id,
         type="expense",
         date__year=today.year,
         date__month=today.month
-    ).order_by('-amount').first()
+    ).select_related('category').order_by('-amount').first()
 
     if not transaction:
         return "You have no expenses this month."
@@ -66,88 +101,64 @@ def get_biggest_expense(user):
     return f"Your biggest expense this month is ${transaction.amount} for {transaction.category.name if transaction.category else 'Uncategorized'} on {transaction.date}. Description: {transaction.description or 'No description'}"
 
 
-def get_budget_status(user):
+def get_budget_status(user_id):
     """Get status of all active budgets"""
     today = now()
     budgets = Budget.objects.filter(
-        user=user,
+        user_id=user_id,
         start_date__lte=today,
         end_date__gte=today
-    ).select_related('category')
+    ).select_related('category').only('amount', 'current_expense', 'category__name')
 
     if not budgets:
         return "You have no active budgets set up."
 
-    result = "Your current budget status:\n"
+    parts = ["Your current budget status:\n"]
     for budget in budgets:
         remaining = budget.remaining
         percentage_used = (budget.current_expense / budget.amount * 100) if budget.amount > 0 else 0
         status = "⚠️ Over budget!" if remaining < 0 else "✓ On track"
 
-        result += f"- {budget.category.name}: ${budget.current_expense} / ${budget.amount} ({percentage_used:.1f}% used) - {status}\n"
+        parts.append(f"- {budget.category.name}: ${budget.current_expense} / ${budget.amount} ({percentage_used:.1f}% used) - {status}\n")
 
-    return result
+    return "".join(parts)
 
 
-def get_recent_transactions(user, limit=10):
+def get_recent_transactions(user_id, limit=10):
     """Get recent transactions"""
     transactions = Transaction.objects.filter(
-        user=user
+        user_id=user_id
     ).select_related('category', 'account').order_by('-date', '-created_at')[:limit]
 
     if not transactions:
         return "You have no transactions yet."
 
-    result = f"Your last {limit} transactions:\n"
+    parts = [f"Your last {limit} transactions:\n"]
     for t in transactions:
-        result += f"- {t.date}: {t.type.title()} ${t.amount} - {t.category.name if t.category else 'Uncategorized'} ({t.account.name})\n"
+        parts.append(f"- {t.date}: {t.type.title()} ${t.amount} - {t.category.name if t.category else 'Uncategorized'} ({t.account.name})\n")
 
-    return result
+    return "".join(parts)
 
 
-def get_account_balances(user):
+def get_account_balances(user_id):
     """Get balances of all user accounts"""
-    accounts = Account.objects.filter(user=user)
+    rows = list(Account.objects.filter(user_id=user_id).only('name', 'account_type', 'balance'))
 
-    if not accounts:
+    if not rows:
         return "You have no accounts set up."
 
-    result = "Your account balances:\n"
-    total = Decimal('0')
-    for account in accounts:
-        result += f"- {account.name} ({account.account_type}): ${account.balance}\n"
-        total += account.balance
+    # Summed from the fetched rows so the tool stays a single query
+    total = sum((account.balance for account in rows), Decimal('0'))
 
-    result += f"\nTotal across all accounts: ${total}"
-    return result
+    lines = [f"- {account.name} ({account.account_type}): ${account.balance}\n" for account in rows]
+    return "Your account balances:\n" + "".join(lines) + f"\nTotal across all accounts: ${total}"
 
 
-def get_spending_trends(user):
+def get_spending_trends(user_id):
     """Get spending comparison between current and last month"""
-    today = now()
-
-    # Current month
-    current_month_expenses = Transaction.objects.filter(
-        user=user,
-        type="expense",
-        date__year=today.year,
-        date__month=today.month
-    ).aggregate(total=Sum('amount'))['total'] or Decimal('0')
-
-    # Last month
-    if today.month == 1:
-        last_month = 12
-        last_year = today.year - 1
-    else:
-        last_month = today.month - 1
-        last_year = today.year
-
-    last_month_expenses = Transaction.objects.filter(
-        user=user,
-        type="expense",
-        date__year=last_year,
-        date__month=last_month
-    ).aggregate(total=Sum('amount'))['total'] or Decimal('0')
+    totals = get_monthly_dashboard(user_id)
+    current_month_expenses = totals['current_expense']
+    last_month_expenses = totals['last_expense']
 
     if last_month_expenses == 0:
         return f"Current month expenses: ${current_month_expenses}. No data for last month to compare."
@@ -160,11 +171,11 @@ def get_spending_trends(user):
     return f"Spending trend: This month ${current_month_expenses} vs last month ${last_month_expenses}. Your spending {trend} by ${abs(difference)} ({abs(percentage_change):.1f}%)."
 
 
-def get_top_spending_category(user):
+def get_top_spending_category(user_id):
     """Get the category with highest spending this month"""
     today = now()
     top_category = Transaction.objects.filter(
-        user=user,
+        user_id=user_id,
         type="expense",
         date__year=today.year,
         date__month=today.month,
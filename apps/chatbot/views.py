@@ -1,13 +1,23 @@
+import json
+import logging
+import queue
+import threading
+from functools import lru_cache
+
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
+from django.db import connection, transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.db.models import Count, Prefetch
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema import SystemMessage, HumanMessage, AIMessage
 from langchain.agents import AgentExecutor, create_tool_calling_agent
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 from .models import Conversation, ChatMessage
@@ -15,6 +25,165 @@ from .serializers import ConversationSerializer, ConversationListSerializer, Cha
 from .agents import tools
 from eta_api.utils.responses import success_response, error_response
 
+logger = logging.getLogger(__name__)
+
+
+SYSTEM_PROMPT = """You are an intelligent financial assistant for an expense tracking application.
+You help users understand their spending patterns, budgets, income, and provide financial insights.
+
+Current user ID: {user_id}
+
+You have access to several tools that can fetch real-time financial data:
+- Total expenses and income for the current month
+- Category breakdown of spending
+- Budget status and alerts
+- Account balances
+- Spending trends
+- Recent transactions
+- Top spending categories
+
+Always use the appropriate tool to fetch accurate, up-to-date information.
+Be friendly, helpful, and provide actionable insights.
+When showing monetary values, always include the currency symbol ($).
+Keep responses concise but informative."""
+
+# Approximate token budget for conversation history (about 4 characters per token)
+HISTORY_TOKEN_BUDGET = 4000
+
+
+@lru_cache(maxsize=1)
+def _chat_client():
+    """Build the Gemini chat model once per process and reuse it across requests"""
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.0-flash-exp",
+        google_api_key=settings.GEMINI_API_KEY,
+        temperature=0.7,
+    )
+
+
+@lru_cache(maxsize=1)
+def _agent_executor():
+    """
+    Build the tool-calling agent once per process.
+    The user id is a prompt variable supplied with each invoke() call.
+    """
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PROMPT),
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+
+    agent = create_tool_calling_agent(_chat_client(), tools, prompt)
+    return AgentExecutor(
+        agent=agent,
+        tools=tools,
+        verbose=True,
+        handle_parsing_errors=True,
+        max_iterations=5,
+    )
+
+
+class _TokenQueueHandler(BaseCallbackHandler):
+    """
+    Forward final-answer LLM tokens to a queue as server-sent event payloads.
+    Runs that turn into tool calls are agent steps, not the reply: their tokens
+    are dropped from the first tool-call chunk on, and any text they already
+    sent is withdrawn with a reset event.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.forwarded_runs = set()
+        self.tool_call_runs = set()
+
+    def on_llm_new_token(self, token, *, chunk=None, run_id=None, **kwargs):
+        if run_id in self.tool_call_runs:
+            return
+
+        message = getattr(chunk, "message", None)
+        if getattr(message, "tool_call_chunks", None):
+            self.tool_call_runs.add(run_id)
+            if run_id in self.forwarded_runs:
+                self.events.put({"type": "reset"})
+            return
+
+        if token:
+            self.forwarded_runs.add(run_id)
+            self.events.put({"type": "token", "content": token})
+
+
+def _save_exchange(conversation, user_message, assistant_response):
+    """
+    Store a completed chat turn: the conversation (new, or with updated_at
+    bumped so the list shows recent activity first), then the user message
+    and the assistant reply in a single INSERT. Both messages usually get the
+    same created_at, so message orderings break ties on id.
+    """
+    with transaction.atomic():
+        if conversation.pk is None:
+            conversation.save()
+        else:
+            conversation.save(update_fields=['updated_at'])
+        ChatMessage.objects.bulk_create([
+            ChatMessage(conversation=conversation, role='user', content=user_message),
+            ChatMessage(conversation=conversation, role='assistant', content=assistant_response),
+        ])
+
+
+def _sse(payload):
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def _stream_agent_reply(conversation, agent_input):
+    """
+    Yield the agent's reply as server-sent events.
+    The agent runs in a worker thread that feeds tokens through a queue, so the
+    first token reaches the client without waiting for the full completion.
+    Driving the executor with stream() makes each LLM call use the model's
+    streaming API, which is what fires on_llm_new_token.
+    Events: token, reset (discard the tokens received so far), then done or error.
+    """
+    events = queue.Queue()
+    done = object()
+    result = {}
+
+    def run_agent():
+        try:
+            result["output"] = "I'm sorry, I couldn't process that request."
+            for step in _agent_executor().stream(
+                agent_input,
+                config={"callbacks": [_TokenQueueHandler(events)]},
+            ):
+                if "output" in step:
+                    result["output"] = step["output"]
+        except Exception as e:
+            result["error"] = e
+        finally:
+            # Tools query the database from this thread
+            connection.close()
+            events.put(done)
+
+    threading.Thread(target=run_agent, daemon=True).start()
+
+    for event in iter(events.get, done):
+        yield _sse(event)
+
+    if "error" in result:
+        logger.error("Chatbot error for user %s", agent_input["user_id"], exc_info=result["error"])
+        yield _sse({
+            "type": "error",
+            "message": "An error occurred while processing your request. Please try again.",
+        })
+        return
+
+    _save_exchange(conversation, agent_input["input"], result["output"])
+    yield _sse({
+        "type": "done",
+        "reply": result["output"],
+        "conversation_id": conversation.id,
+    })
+
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
@@ -24,7 +193,8 @@ def chatbot_view(request):
     Request body:
     {
         "message": "What were my expenses this month?",
-        "conversation_id": 123  // optional, for continuing a conversation
+        "conversation_id": 123,  // optional, for continuing a conversation
+        "stream": true  // optional, reply as server-sent events
     }
     """
     user_message = request.data.get("message", "").strip()
@@ -36,97 +206,64 @@ def chatbot_view(request):
             status=400
         )
 
-    # Get or create conversation
+    # Get or create conversation, with its last 10 messages for context
+    messages_for_llm = []
     if conversation_id:
         conversation = get_object_or_404(
             Conversation,
             id=conversation_id,
             user=request.user
         )
+
+        # Read before saving the new message so it is not part of the history
+        history_messages = conversation.messages.order_by('-created_at', '-id').values_list(
+            'role', 'content'
+        )[:10]
+
+        # Keep the newest messages that fit the token budget
+        history = []
+        tokens_left = HISTORY_TOKEN_BUDGET
+        for role, content in history_messages:
+            tokens_left -= len(content) // 4 + 1
+            if tokens_left < 0:
+                break
+            history.append((role, content))
+
+        for role, content in reversed(history):
+            if role == 'user':
+                messages_for_llm.append(HumanMessage(content=content))
+            elif role == 'assistant':
+                messages_for_llm.append(AIMessage(content=content))
     else:
-        # Create new conversation with title from first message
-        conversation = Conversation.objects.create(
+        # New conversation with title from first message, saved with the first reply
+        conversation = Conversation(
             user=request.user,
             title=user_message[:100]  # Use first 100 chars as title
         )
 
-    # Save user message
-    ChatMessage.objects.create(
-        conversation=conversation,
-        role='user',
-        content=user_message
-    )
-
-    # Get conversation history (last 10 messages for context)
-    history_messages = conversation.messages.all()[:10]
-    messages_for_llm = []
-
-    for msg in history_messages:
-        if msg.role == 'user':
-            messages_for_llm.append(HumanMessage(content=msg.content))
-        elif msg.role == 'assistant':
-            messages_for_llm.append(AIMessage(content=msg.content))
-
-    # Initialize Gemini chat model
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash-exp",
-        google_api_key=settings.GEMINI_API_KEY,
-        temperature=0.7,
-    )
-
-    # Create system prompt with user context
-    system_prompt = f"""You are an intelligent financial assistant for an expense tracking application.
-You help users understand their spending patterns, budgets, income, and provide financial insights.
-
-Current user ID: {request.user.id}
-
-You have access to several tools that can fetch real-time financial data:
-- Total expenses and income for the current month
-- Category breakdown of spending
-- Budget status and alerts
-- Account balances
-- Spending trends
-- Recent transactions
-- Top spending categories
-
-Always use the appropriate tool to fetch accurate, up-to-date information.
-Be friendly, helpful, and provide actionable insights.
-When showing monetary values, always include the currency symbol ($).
-Keep responses concise but informative."""
-
-    # Create the prompt template for the agent
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_prompt),
-        MessagesPlaceholder(variable_name="chat_history", optional=True),
-        ("human", "{input}"),
-        MessagesPlaceholder(variable_name="agent_scratchpad"),
-    ])
+    agent_input = {
+        "input": user_message,
+        "user_id": str(request.user.id),
+        "chat_history": messages_for_llm,
+    }
 
-    # Create tool-calling agent
-    agent = create_tool_calling_agent(llm, tools, prompt)
-    agent_executor = AgentExecutor(
-        agent=agent,
-        tools=tools,
-        verbose=True,
-        handle_parsing_errors=True,
-        max_iterations=5,
-    )
+    if request.data.get("stream"):
+        response = StreamingHttpResponse(
+            _stream_agent_reply(conversation, agent_input),
+            content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
 
     try:
         # Invoke the agent with user message and conversation history
-        result = agent_executor.invoke({
-            "input": user_message,
-            "chat_history": messages_for_llm[:-1] if len(messages_for_llm) > 0 else [],
-        })
+        result = _agent_executor().invoke(agent_input)
 
         assistant_response = result.get("output", "I'm sorry, I couldn't process that request.")
 
-        # Save assistant response
-        ChatMessage.objects.create(
-            conversation=conversation,
-            role='assistant',
-            content=assistant_response
-        )
+        # Save the user message and assistant response together
+        _save_exchange(conversation, user_message, assistant_response)
 
         return success_response(
             message="Response generated successfully",
@@ -138,7 +275,7 @@ Keep responses concise but informative."""
 
     except Exception as e:
         # Log the error and return user-friendly message
-        print(f"Chatbot error: {str(e)}")
+        logger.exception("Chatbot error for user %s", request.user.id)
         return error_response(
             message="An error occurred while processing your request. Please try again.",
             errors={"detail": str(e)},
@@ -150,7 +287,15 @@ Keep responses concise but informative."""
 @permission_classes([IsAuthenticated])
 def conversation_list_view(request):
     """Get all conversations for the authenticated user"""
-    conversations = Conversation.objects.filter(user=request.user)
+    conversations = Conversation.objects.filter(user=request.user).annotate(
+        message_count=Count('messages')
+    ).prefetch_related(
+        Prefetch(
+            'messages',
+            queryset=ChatMessage.objects.order_by('-created_at', '-id')[:1],
+            to_attr='latest_messages'
+        )
+    )
     serializer = ConversationListSerializer(conversations, many=True)
     return success_response(
         message="Conversations retrieved successfully",
@@ -163,7 +308,7 @@ def conversation_list_view(request):
 def conversation_detail_view(request, conversation_id):
     """Get a specific conversation with all messages"""
     conversation = get_object_or_404(
-        Conversation,
+        Conversation.objects.prefetch_related('messages'),
         id=conversation_id,
         user=request.user
     )
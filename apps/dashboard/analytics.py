@@ -5,15 +5,23 @@ Provides helper functions for financial calculations and predictions
 
 from decimal import Decimal
 from datetime import timedelta, datetime
-from django.db.models import Sum, Avg, Count, StdDev, Max, Min
-from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
+from django.db.models import Sum, Avg, Count, StdDev, Max, Min, Q, F, FloatField
+from django.db.models.functions import Cast, ExtractIsoWeekDay, TruncWeek, TruncMonth
+from django.conf import settings
 from django.utils.timezone import now
 from apps.transactions.models import Transaction
 from apps.budgets.models import Budget
 from apps.accounts.models import Account
+from eta_api.utils.cache import cached_per_user
+from eta_api.utils.dates import add_months
 import statistics
 
+# Display-only statistics (averages, extremes) are read as floats straight from the
+# database; sums stay Decimal so totals are exact
+AMOUNT_AS_FLOAT = Cast('amount', FloatField())
 
+
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def calculate_financial_health_score(user):
     """
     Calculate a financial health score (0-100) based on multiple factors:
@@ -27,17 +35,20 @@ def calculate_financial_health_score(user):
 
     # Get current month data
     today = now()
+    month_start = today.date().replace(day=1)
     current_month_transactions = Transaction.objects.filter(
         user=user,
-        date__year=today.year,
-        date__month=today.month
+        date__gte=month_start,
+        date__lt=add_months(month_start, 1)
     )
 
     # 1. Savings Rate (40 points)
-    total_income = current_month_transactions.filter(type='income').aggregate(
-        total=Sum('amount'))['total'] or Decimal('0')
-    total_expense = current_month_transactions.filter(type='expense').aggregate(
-        total=Sum('amount'))['total'] or Decimal('0')
+    totals = current_month_transactions.aggregate(
+        income=Sum('amount', filter=Q(type='income')),
+        expense=Sum('amount', filter=Q(type='expense'))
+    )
+    total_income = totals['income'] or Decimal('0')
+    total_expense = totals['expense'] or Decimal('0')
 
     if total_income > 0:
         savings_rate = ((total_income - total_expense) / total_income) * 100
@@ -51,20 +62,18 @@ def calculate_financial_health_score(user):
         details['savings_points'] = 0
 
     # 2. Budget Adherence (30 points)
-    active_budgets = Budget.objects.filter(
+    budget_counts = Budget.objects.filter(
         user=user,
         start_date__lte=today,
         end_date__gte=today
+    ).aggregate(
+        total=Count('id'),
+        on_track=Count('id', filter=Q(current_expense__lte=F('amount')))
     )
+    total_budgets = budget_counts['total']
 
-    if active_budgets.exists():
-        budgets_on_track = 0
-        total_budgets = active_budgets.count()
-
-        for budget in active_budgets:
-            if budget.current_expense <= budget.amount:
-                budgets_on_track += 1
-
+    if total_budgets:
+        budgets_on_track = budget_counts['on_track']
         budget_adherence = (budgets_on_track / total_budgets) * 100
         budget_points = (budget_adherence / 100) * 30
         score += budget_points
@@ -75,16 +84,19 @@ def calculate_financial_health_score(user):
         details['budget_points'] = 0
 
     # 3. Spending Stability (20 points) - Lower variance is better
-    last_3_months_expenses = []
-    for i in range(3):
-        month_date = today - timedelta(days=30 * i)
-        month_expense = Transaction.objects.filter(
-            user=user,
-            type='expense',
-            date__year=month_date.year,
-            date__month=month_date.month
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0')
-        last_3_months_expenses.append(float(month_expense))
+    month_starts = [add_months(month_start, -i) for i in range(3)]
+    monthly_expenses = Transaction.objects.filter(
+        user=user,
+        type='expense',
+        date__gte=month_starts[-1],
+        date__lt=add_months(month_start, 1)
+    ).annotate(
+        month=TruncMonth('date')
+    ).values('month').annotate(
+        total=Sum('amount')
+    )
+    expense_map = {row['month']: row['total'] for row in monthly_expenses}
+    last_3_months_expenses = [float(expense_map.get(start) or Decimal('0')) for start in month_starts]
 
     if len(last_3_months_expenses) > 1 and any(last_3_months_expenses):
         try:
@@ -142,32 +154,35 @@ def get_health_rating(score):
         return "Critical"
 
 
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def calculate_spending_growth_rate(user, account_id=None):
     """Calculate month-over-month and year-over-year growth rates"""
     today = now()
 
-    # Current month
-    current_month = Transaction.objects.filter(
-        user=user,
-        type='expense',
-        date__year=today.year,
-        date__month=today.month
-    )
-    if account_id:
-        current_month = current_month.filter(account_id=account_id)
-    current_expense = current_month.aggregate(total=Sum('amount'))['total'] or Decimal('0')
+    month_start = today.date().replace(day=1)
+    last_month_start = add_months(month_start, -1)
+    last_year_start = add_months(month_start, -12)
+
+    current_q = Q(date__gte=month_start, date__lt=add_months(month_start, 1))
+    last_month_q = Q(date__gte=last_month_start, date__lt=month_start)
+    last_year_q = Q(date__gte=last_year_start, date__lt=add_months(last_year_start, 1))
 
-    # Last month
-    last_month_date = today - timedelta(days=30)
-    last_month = Transaction.objects.filter(
+    # Current month, last month and last year's same month in one query
+    expenses = Transaction.objects.filter(
+        current_q | last_month_q | last_year_q,
         user=user,
-        type='expense',
-        date__year=last_month_date.year,
-        date__month=last_month_date.month
+        type='expense'
     )
     if account_id:
-        last_month = last_month.filter(account_id=account_id)
-    last_month_expense = last_month.aggregate(total=Sum('amount'))['total'] or Decimal('0')
+        expenses = expenses.filter(account_id=account_id)
+    totals = expenses.aggregate(
+        current=Sum('amount', filter=current_q),
+        last_month=Sum('amount', filter=last_month_q),
+        last_year=Sum('amount', filter=last_year_q)
+    )
+    current_expense = totals['current'] or Decimal('0')
+    last_month_expense = totals['last_month'] or Decimal('0')
+    last_year_expense = totals['last_year'] or Decimal('0')
 
     # Month-over-Month growth
     mom_growth = 0
@@ -175,17 +190,6 @@ def calculate_spending_growth_rate(user, account_id=None):
         mom_growth = ((current_expense - last_month_expense) / last_month_expense) * 100
 
     # Year-over-Year growth
-    last_year_date = today.replace(year=today.year - 1)
-    last_year = Transaction.objects.filter(
-        user=user,
-        type='expense',
-        date__year=last_year_date.year,
-        date__month=last_year_date.month
-    )
-    if account_id:
-        last_year = last_year.filter(account_id=account_id)
-    last_year_expense = last_year.aggregate(total=Sum('amount'))['total'] or Decimal('0')
-
     yoy_growth = 0
     if last_year_expense > 0:
         yoy_growth = ((current_expense - last_year_expense) / last_year_expense) * 100
@@ -200,6 +204,7 @@ def calculate_spending_growth_rate(user, account_id=None):
     }
 
 
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def forecast_cash_flow(user, months_ahead=3):
     """
     Predict future cash flow based on historical averages
@@ -209,22 +214,25 @@ def forecast_cash_flow(user, months_ahead=3):
     forecasts = []
 
     # Calculate average monthly income and expense from last 6 months
+    month_start = today.date().replace(day=1)
+    month_starts = [add_months(month_start, -i) for i in range(6)]
+
+    # One grouped query for all months instead of two aggregates per month
+    monthly_totals = Transaction.objects.filter(
+        user=user,
+        date__gte=month_starts[-1],
+        date__lt=add_months(month_start, 1)
+    ).annotate(
+        month=TruncMonth('date')
+    ).values('month', 'type').annotate(
+        total=Sum('amount')
+    )
+    totals_map = {(row['month'], row['type']): row['total'] for row in monthly_totals}
+
     monthly_data = []
-    for i in range(6):
-        month_date = today - timedelta(days=30 * i)
-        income = Transaction.objects.filter(
-            user=user,
-            type='income',
-            date__year=month_date.year,
-            date__month=month_date.month
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0')
-
-        expense = Transaction.objects.filter(
-            user=user,
-            type='expense',
-            date__year=month_date.year,
-            date__month=month_date.month
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0')
+    for start in month_starts:
+        income = totals_map.get((start, 'income')) or Decimal('0')
+        expense = totals_map.get((start, 'expense')) or Decimal('0')
 
         monthly_data.append({
             'income': float(income),
@@ -250,7 +258,7 @@ def forecast_cash_flow(user, months_ahead=3):
     # Generate forecasts
     for i in range(1, months_ahead + 1):
         projected_balance += avg_net
-        future_date = today + timedelta(days=30 * i)
+        future_date = add_months(month_start, i)
 
         forecasts.append({
             'month': future_date.strftime('%Y-%m'),
@@ -268,6 +276,7 @@ def forecast_cash_flow(user, months_ahead=3):
     }
 
 
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def calculate_budget_burn_rate(user):
     """Calculate how fast budgets are being consumed"""
     today = now()
@@ -275,19 +284,26 @@ def calculate_budget_burn_rate(user):
         user=user,
         start_date__lte=today,
         end_date__gte=today
-    ).select_related('category')
+    ).values(
+        'category__name', 'amount', 'current_expense', 'start_date', 'end_date'
+    )
 
     burn_rates = []
 
-    for budget in active_budgets:
+    for budget in active_budgets.iterator(chunk_size=100):
+        amount = budget['amount']
+        current_expense = budget['current_expense']
+        start_date = budget['start_date']
+        end_date = budget['end_date']
+
         # Calculate days elapsed and remaining
-        total_days = (budget.end_date - budget.start_date).days + 1
-        elapsed_days = (today.date() - budget.start_date).days + 1
-        remaining_days = (budget.end_date - today.date()).days
+        total_days = (end_date - start_date).days + 1
+        elapsed_days = (today.date() - start_date).days + 1
+        remaining_days = (end_date - today.date()).days
 
         if elapsed_days > 0:
             # Daily burn rate
-            daily_burn = budget.current_expense / elapsed_days
+            daily_burn = current_expense / elapsed_days
 
             # Projected total spend if rate continues
             projected_spend = daily_burn * total_days
@@ -295,12 +311,12 @@ def calculate_budget_burn_rate(user):
             # Days until budget exhausted (if over-spending)
             days_to_exhaust = None
             if daily_burn > 0:
-                remaining_budget = budget.amount - budget.current_expense
+                remaining_budget = amount - current_expense
                 if remaining_budget > 0:
                     days_to_exhaust = int(remaining_budget / daily_burn)
 
             # Health status
-            percent_used = (budget.current_expense / budget.amount * 100) if budget.amount > 0 else 0
+            percent_used = (current_expense / amount * 100) if amount > 0 else 0
             percent_time_elapsed = (elapsed_days / total_days * 100)
 
             if percent_used > percent_time_elapsed + 20:
@@ -311,9 +327,9 @@ def calculate_budget_burn_rate(user):
                 status = "on_track"
 
             burn_rates.append({
-                'category': budget.category.name,
-                'budget_amount': float(budget.amount),
-                'current_expense': float(budget.current_expense),
+                'category': budget['category__name'],
+                'budget_amount': float(amount),
+                'current_expense': float(current_expense),
                 'daily_burn_rate': round(float(daily_burn), 2),
                 'projected_total': round(float(projected_spend), 2),
                 'days_elapsed': elapsed_days,
@@ -327,6 +343,7 @@ def calculate_budget_burn_rate(user):
     return burn_rates
 
 
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def analyze_spending_patterns(user, account_id=None):
     """Analyze daily and weekly spending patterns"""
     today = now()
@@ -341,28 +358,24 @@ def analyze_spending_patterns(user, account_id=None):
     if account_id:
         transactions = transactions.filter(account_id=account_id)
 
-    # Daily patterns (day of week)
-    daily_data = transactions.annotate(
-        day=TruncDay('date')
-    ).values('day').annotate(
+    # Daily patterns (day of week), grouped in the database
+    weekday_data = transactions.annotate(
+        weekday=ExtractIsoWeekDay('date')
+    ).values('weekday').annotate(
         total=Sum('amount'),
-        count=Count('id')
-    ).order_by('day')
-
-    # Group by day of week
-    day_of_week_totals = {i: [] for i in range(7)}  # 0=Monday, 6=Sunday
-
-    for item in daily_data:
-        day_of_week = item['day'].weekday()
-        day_of_week_totals[day_of_week].append(float(item['total']))
+        days=Count('date', distinct=True)
+    )
+    weekday_totals = {item['weekday']: item for item in weekday_data}  # 1=Monday, 7=Sunday
 
     day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     daily_pattern = []
 
-    for i, day_name in enumerate(day_names):
-        if day_of_week_totals[i]:
-            avg_spending = statistics.mean(day_of_week_totals[i])
-            total_transactions = len(day_of_week_totals[i])
+    for i, day_name in enumerate(day_names, start=1):
+        item = weekday_totals.get(i)
+        if item:
+            # Average of the per-day totals for this weekday
+            avg_spending = float(item['total']) / item['days']
+            total_transactions = item['days']
         else:
             avg_spending = 0
             total_transactions = 0
@@ -395,29 +408,31 @@ def analyze_spending_patterns(user, account_id=None):
     }
 
 
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def get_category_intelligence(user, account_id=None):
     """Get detailed intelligence about category spending"""
-    today = now()
+    month_start = now().date().replace(day=1)
     current_month = Transaction.objects.filter(
         user=user,
         type='expense',
-        date__year=today.year,
-        date__month=today.month
+        date__gte=month_start,
+        date__lt=add_months(month_start, 1)
     )
 
     if account_id:
         current_month = current_month.filter(account_id=account_id)
 
     # Category statistics
-    category_stats = current_month.values('category__name').annotate(
+    category_stats = list(current_month.values('category__name').annotate(
         total=Sum('amount'),
         count=Count('id'),
-        avg=Avg('amount'),
-        max=Max('amount'),
-        min=Min('amount')
-    ).order_by('-total')
+        avg=Avg(AMOUNT_AS_FLOAT),
+        max=Max(AMOUNT_AS_FLOAT),
+        min=Min(AMOUNT_AS_FLOAT)
+    ).order_by('-total'))
 
-    total_spending = sum([float(c['total']) for c in category_stats])
+    # Percentages come from the grouped rows themselves; no second query for the total
+    total_spending = sum(float(c['total'] or 0) for c in category_stats)
 
     categories = []
     for cat in category_stats:
@@ -425,7 +440,7 @@ def get_category_intelligence(user, account_id=None):
 
         categories.append({
             'category': cat['category__name'] or 'Uncategorized',
-            'total_spent': float(cat['total']),
+            'total_spent': float(cat['total'] or 0),
             'percentage_of_total': round(percentage, 2),
             'transaction_count': cat['count'],
             'average_transaction': round(float(cat['avg']), 2),
@@ -440,6 +455,7 @@ def get_category_intelligence(user, account_id=None):
     }
 
 
+@cached_per_user("analytics", settings.ANALYTICS_CACHE_TTL)
 def get_transaction_statistics(user, account_id=None, days=30):
     """Get statistical analysis of transactions"""
     today = now()
@@ -453,24 +469,26 @@ def get_transaction_statistics(user, account_id=None, days=30):
     if account_id:
         transactions = transactions.filter(account_id=account_id)
 
-    # Income statistics
-    income_stats = transactions.filter(type='income').aggregate(
-        total=Sum('amount'),
-        count=Count('id'),
-        avg=Avg('amount'),
-        max=Max('amount'),
-        min=Min('amount')
-    )
-
-    # Expense statistics
-    expense_stats = transactions.filter(type='expense').aggregate(
-        total=Sum('amount'),
-        count=Count('id'),
-        avg=Avg('amount'),
-        max=Max('amount'),
-        min=Min('amount'),
-        stddev=StdDev('amount')
+    # Income and expense statistics in one pass
+    is_income = Q(type='income')
+    is_expense = Q(type='expense')
+    stats = transactions.aggregate(
+        income_total=Sum('amount', filter=is_income),
+        income_count=Count('id', filter=is_income),
+        income_avg=Avg(AMOUNT_AS_FLOAT, filter=is_income),
+        income_max=Max(AMOUNT_AS_FLOAT, filter=is_income),
+        income_min=Min(AMOUNT_AS_FLOAT, filter=is_income),
+        expense_total=Sum('amount', filter=is_expense),
+        expense_count=Count('id', filter=is_expense),
+        expense_avg=Avg(AMOUNT_AS_FLOAT, filter=is_expense),
+        expense_max=Max(AMOUNT_AS_FLOAT, filter=is_expense),
+        expense_min=Min(AMOUNT_AS_FLOAT, filter=is_expense),
+        expense_stddev=StdDev('amount', filter=is_expense)
     )
+    income_stats = {key: stats[f'income_{key}'] for key in ('total', 'count', 'avg', 'max', 'min')}
+    expense_stats = {
+        key: stats[f'expense_{key}'] for key in ('total', 'count', 'avg', 'max', 'min', 'stddev')
+    }
 
     # Calculate outliers (transactions > 2 standard deviations from mean)
     outliers = []
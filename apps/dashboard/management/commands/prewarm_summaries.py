@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.utils.timezone import now
+
+from apps.users.models import User
+from apps.transactions.models import Transaction
+from apps.dashboard.summary_cache import cached_summary
+from apps.dashboard.views import (
+    summary_data,
+    category_breakdown_data,
+    budget_vs_actual_data,
+    monthly_trend_data,
+)
+from apps.dashboard.analytics import (
+    calculate_financial_health_score,
+    calculate_spending_growth_rate,
+    forecast_cash_flow,
+    calculate_budget_burn_rate,
+    analyze_spending_patterns,
+    get_category_intelligence,
+    get_transaction_statistics,
+)
+
+SUMMARIES = [
+    ("summary", summary_data),
+    ("category-breakdown", category_breakdown_data),
+    ("budget-vs-actual", budget_vs_actual_data),
+    ("monthly-trend", monthly_trend_data),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Warm the dashboard cache (unfiltered views) for recently active users. "
+        "Run from cron more often than SUMMARY_CACHE_TTL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=24,
+            help='Warm users who added transactions within this many hours',
+        )
+
+    def handle(self, *args, **options):
+        # Entries written to a per-process or disabled cache never reach the
+        # web workers
+        if isinstance(caches["default"], (DummyCache, LocMemCache)):
+            self.stdout.write(self.style.WARNING(
+                "The default cache is not shared (set REDIS_URL); nothing to warm"
+            ))
+            return
+
+        # JWT logins do not update last_login, so activity is judged by
+        # recently added transactions
+        since = now() - timedelta(hours=options['hours'])
+        users = User.objects.filter(
+            Exists(Transaction.objects.filter(user=OuterRef("pk"), created_at__gte=since)),
+            is_active=True
+        )
+
+        warmed = 0
+        for user in users.iterator():
+            for endpoint, compute in SUMMARIES:
+                cached_summary(user, endpoint, lambda: compute(user))
+
+            # Same arguments as the views pass without query params
+            calculate_financial_health_score(user)
+            calculate_spending_growth_rate(user, None)
+            forecast_cash_flow(user, 3)
+            calculate_budget_burn_rate(user)
+            analyze_spending_patterns(user, None)
+            get_category_intelligence(user, None)
+            get_transaction_statistics(user, None, 30)
+            warmed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Warmed dashboard cache for {warmed} users"))
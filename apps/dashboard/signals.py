@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.transactions.models import Transaction
+from apps.budgets.models import Budget
+from apps.accounts.models import Account
+from apps.categories.models import Category
+from eta_api.utils.cache import invalidate_user_cache
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_dashboard_cache(sender, instance, **kwargs):
+    """Drop the user's cached dashboard data whenever their financial data changes"""
+    invalidate_user_cache(instance.user_id, "analytics", "summary")
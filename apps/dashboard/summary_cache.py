@@ -0,0 +1,20 @@
+# dashboard/summary_cache.py
+from django.conf import settings
+
+from eta_api.utils.cache import get_or_set_for_user, params_hash
+
+
+def cached_summary(user, endpoint, compute, params=()):
+    """
+    Return the cached dashboard payload for the user, endpoint and query params,
+    computing it on a miss. apps.dashboard.signals drops the user's entries on
+    every write to their financial data.
+    """
+    return get_or_set_for_user(
+        "summary", user.pk, compute, settings.SUMMARY_CACHE_TTL, endpoint, params_hash(params)
+    )
+
+
+def cached_json(endpoint, request, compute):
+    """cached_summary() keyed by the request's user and query string"""
+    return cached_summary(request.user, endpoint, compute, request.GET.items())
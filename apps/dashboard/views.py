@@ -1,3 +1,4 @@
+from datetime import date, datetime
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from eta_api.utils.responses import success_response
@@ -5,9 +6,9 @@ from apps.transactions.models import Transaction
 from apps.budgets.models import Budget
 from apps.categories.models import Category
 from apps.accounts.models import Account
-from django.db.models import Sum
-from django.db.models.functions import TruncMonth
+from django.db.models import CharField, Func, OuterRef, Q, Subquery, Sum, Value
 from django.utils.timezone import now
+from .summary_cache import cached_json
 from .analytics import (
     calculate_financial_health_score,
     calculate_spending_growth_rate,
@@ -30,33 +31,20 @@ def get_transactions(user, account_id=None, type=None):
 
 
 # 1. Dashboard summary
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def summary_view(request):
-    user = request.user
-    account_id = request.GET.get("account")  # optional filter
-
-    total_income = (
-        get_transactions(user, account_id, type="income").aggregate(
-            total=Sum("amount")
-        )["total"]
-        or 0
-    )
-
-    total_expense = (
-        get_transactions(user, account_id, type="expense").aggregate(
+def summary_data(user, account_id=None):
+    # Income and expense totals from one GROUP BY type query
+    totals = dict(
+        get_transactions(user, account_id).values_list("type").annotate(
             total=Sum("amount")
-        )["total"]
-        or 0
+        )
     )
+    total_income = totals.get("income") or 0
+    total_expense = totals.get("expense") or 0
 
-    # Optionally show account balances if no filter
+    # Optionally show account balances if no filter (balance is a stored column)
     accounts_data = []
     if not account_id:
-        for acc in user.accounts.all():
-            accounts_data.append(
-                {"id": acc.id, "name": acc.name, "balance": acc.balance}
-            )
+        accounts_data = list(user.accounts.values("id", "name", "balance"))
 
     data = {
         "total_income": total_income,
@@ -64,93 +52,130 @@ def summary_view(request):
         "net_balance": total_income - total_expense,
         "accounts": accounts_data,
     }
-
-    return success_response(data, message="Dashboard summary fetched successfully")
+    return data
 
 
-# 2. Category breakdown
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def category_breakdown_view(request):
+def summary_view(request):
     user = request.user
     account_id = request.GET.get("account")  # optional filter
 
+    data = cached_json("summary", request, lambda: summary_data(user, account_id))
+    return success_response(data, message="Dashboard summary fetched successfully")
+
+
+# 2. Category breakdown
+def category_breakdown_data(user, account_id=None):
     transactions = get_transactions(user, account_id)
-    categories = transactions.values("category__name", "type").annotate(
+    categories = transactions.values_list("category__name", "type").annotate(
         total=Sum("amount")
     )
 
     data = {"income": [], "expense": []}
-    for c in categories:
-        entry = {"category": c["category__name"], "total": c["total"]}
-        if c["type"] == "income":
+    for name, type_, total in categories:
+        entry = {"category": name, "total": total}
+        if type_ == "income":
             data["income"].append(entry)
         else:
             data["expense"].append(entry)
-
-    return success_response(data, message="Category breakdown fetched successfully")
+    return data
 
 
-# 3. Budget vs Actual
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def budget_vs_actual_view(request):
+def category_breakdown_view(request):
     user = request.user
     account_id = request.GET.get("account")  # optional filter
 
-    # Budgets by category
-    budgets = Budget.objects.filter(user=user).values("category__name", "amount")
+    data = cached_json(
+        "category-breakdown", request, lambda: category_breakdown_data(user, account_id)
+    )
+    return success_response(data, message="Category breakdown fetched successfully")
+
 
-    # Actual expenses filtered by account if provided
+# 3. Budget vs Actual
+def budget_vs_actual_data(user, account_id=None):
+    # Actual expenses per budget category, filtered by account if provided
     actuals = (
         get_transactions(user, account_id, type="expense")
-        .values("category__name")
+        .filter(category=OuterRef("category"))
+        .values("category")
         .annotate(total=Sum("amount"))
+        .values("total")
+    )
+
+    # Budgets with their actual spend joined in as a subquery
+    budgets = (
+        Budget.objects.filter(user=user)
+        .annotate(actual=Subquery(actuals))
+        .values("category__name", "amount", "actual")
     )
-    actuals_map = {a["category__name"]: a["total"] for a in actuals}
 
     data = []
     for b in budgets:
-        cat_name = b["category__name"]
         budget_amount = b["amount"]
-        actual_spent = actuals_map.get(cat_name, 0)
+        actual_spent = b["actual"] or 0
         data.append(
             {
-                "category": cat_name,
+                "category": b["category__name"],
                 "budget": budget_amount,
                 "actual": actual_spent,
                 "remaining": budget_amount - actual_spent,
             }
         )
-
-    return success_response(data, message="Budget vs Actual fetched successfully")
+    return data
 
 
-# 4. Monthly trend
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def monthly_trend_view(request):
+def budget_vs_actual_view(request):
     user = request.user
     account_id = request.GET.get("account")  # optional filter
 
-    transactions = (
+    data = cached_json(
+        "budget-vs-actual", request, lambda: budget_vs_actual_data(user, account_id)
+    )
+    return success_response(data, message="Budget vs Actual fetched successfully")
+
+
+# 4. Monthly trend
+def monthly_trend_data(user, account_id=None):
+    # One row per month with income and expense already pivoted
+    months = (
         get_transactions(user, account_id)
-        .annotate(month=TruncMonth("date"))
-        .values("month", "type")
-        .annotate(total=Sum("amount"))
+        .annotate(
+            month=Func(
+                "date", Value("YYYY-MM"), function="to_char", output_field=CharField()
+            )
+        )
+        .values("month")
+        .annotate(
+            income=Sum("amount", filter=Q(type="income")),
+            expense=Sum("amount", filter=Q(type="expense")),
+        )
         .order_by("month")
     )
 
-    data = {}
-    for t in transactions:
-        month_str = t["month"].strftime("%Y-%m")
-        if month_str not in data:
-            data[month_str] = {"month": month_str, "income": 0, "expense": 0}
-        data[month_str][t["type"]] = t["total"]
+    # Months arrive from PostgreSQL already formatted as YYYY-MM
+    return [
+        {
+            "month": m["month"],
+            "income": m["income"] or 0,
+            "expense": m["expense"] or 0,
+        }
+        for m in months
+    ]
+
 
-    return success_response(
-        list(data.values()), message="Monthly trend fetched successfully"
-    )
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def monthly_trend_view(request):
+    user = request.user
+    account_id = request.GET.get("account")  # optional filter
+
+    data = cached_json("monthly-trend", request, lambda: monthly_trend_data(user, account_id))
+    return success_response(data, message="Monthly trend fetched successfully")
 
 
 # 5. Financial Health Score
@@ -255,6 +280,17 @@ def transaction_statistics_view(request):
 
 
 # 12. Period Comparison (Custom Date Ranges)
+def parse_date_param(value):
+    """
+    Parse a YYYY-MM-DD query param, accepting what strptime("%Y-%m-%d") does.
+    date.fromisoformat is only the fast path for the zero-padded form, since on
+    its own it would also accept 20240105 or ISO week dates like 2024-W01-1.
+    """
+    if value and len(value) == 10 and value[4] == value[7] == "-":
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def period_comparison_view(request):
@@ -265,47 +301,35 @@ def period_comparison_view(request):
     - period2_start, period2_end (required)
     - account (optional)
     """
-    from datetime import datetime
-
     user = request.user
     account_id = request.GET.get("account")
 
     try:
         # Parse period 1
-        period1_start = datetime.strptime(request.GET.get("period1_start"), "%Y-%m-%d").date()
-        period1_end = datetime.strptime(request.GET.get("period1_end"), "%Y-%m-%d").date()
+        period1_start = parse_date_param(request.GET.get("period1_start"))
+        period1_end = parse_date_param(request.GET.get("period1_end"))
 
         # Parse period 2
-        period2_start = datetime.strptime(request.GET.get("period2_start"), "%Y-%m-%d").date()
-        period2_end = datetime.strptime(request.GET.get("period2_end"), "%Y-%m-%d").date()
-
-        # Get transactions for period 1
-        period1_transactions = Transaction.objects.filter(
-            user=user,
-            date__gte=period1_start,
-            date__lte=period1_end
-        )
-        if account_id:
-            period1_transactions = period1_transactions.filter(account_id=account_id)
-
-        period1_income = period1_transactions.filter(type='income').aggregate(
-            total=Sum('amount'))['total'] or 0
-        period1_expense = period1_transactions.filter(type='expense').aggregate(
-            total=Sum('amount'))['total'] or 0
-
-        # Get transactions for period 2
-        period2_transactions = Transaction.objects.filter(
-            user=user,
-            date__gte=period2_start,
-            date__lte=period2_end
-        )
+        period2_start = parse_date_param(request.GET.get("period2_start"))
+        period2_end = parse_date_param(request.GET.get("period2_end"))
+
+        # Totals for both periods from one conditional aggregate
+        in_period1 = Q(date__gte=period1_start, date__lte=period1_end)
+        in_period2 = Q(date__gte=period2_start, date__lte=period2_end)
+        transactions = Transaction.objects.filter(in_period1 | in_period2, user=user)
         if account_id:
-            period2_transactions = period2_transactions.filter(account_id=account_id)
+            transactions = transactions.filter(account_id=account_id)
 
-        period2_income = period2_transactions.filter(type='income').aggregate(
-            total=Sum('amount'))['total'] or 0
-        period2_expense = period2_transactions.filter(type='expense').aggregate(
-            total=Sum('amount'))['total'] or 0
+        totals = transactions.aggregate(
+            period1_income=Sum('amount', filter=in_period1 & Q(type='income')),
+            period1_expense=Sum('amount', filter=in_period1 & Q(type='expense')),
+            period2_income=Sum('amount', filter=in_period2 & Q(type='income')),
+            period2_expense=Sum('amount', filter=in_period2 & Q(type='expense'))
+        )
+        period1_income = totals['period1_income'] or 0
+        period1_expense = totals['period1_expense'] or 0
+        period2_income = totals['period2_income'] or 0
+        period2_expense = totals['period2_expense'] or 0
 
         # Calculate differences
         income_diff = period2_income - period1_income
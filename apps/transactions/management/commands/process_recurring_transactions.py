@@ -1,8 +1,19 @@
 from django.core.management.base import BaseCommand
 from django.utils.timezone import now
-from django.db import models
+from django.db import models, transaction
 from datetime import timedelta
 from apps.transactions.models import Transaction, RecurringTransaction
+from apps.transactions.signals import apply_bulk_created_transactions
+
+BATCH_SIZE = 1000
+
+# Time between runs for each frequency
+FREQUENCY_INTERVALS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+    "monthly": timedelta(days=30),  # approximately one month, can be refined
+    "yearly": timedelta(days=365),
+}
 
 
 class Command(BaseCommand):
@@ -22,54 +33,64 @@ class Command(BaseCommand):
         self.stdout.write(f"Processing recurring transactions for {today}")
 
         # Get all active recurring transactions
-        recurring_transactions = RecurringTransaction.objects.filter(
+        active_recurring = RecurringTransaction.objects.filter(
             start_date__lte=today
         ).filter(
             models.Q(end_date__isnull=True) | models.Q(end_date__gte=today)
         )
 
+        # Only the ones due today, with the account and category names used in
+        # the output joined in
+        recurring_transactions = active_recurring.filter(
+            self.due_filter(today)
+        ).select_related(
+            'account', 'category'
+        ).only(
+            'user_id', 'account__name', 'category__name', 'category__type', 'type',
+            'amount', 'description', 'frequency', 'start_date', 'last_processed_date'
+        )
+
         processed_count = 0
-        skipped_count = 0
-
-        for recurring in recurring_transactions:
-            # Check if we should process this recurring transaction today
-            should_process = self.should_process_today(recurring, today)
-
-            if should_process:
-                if dry_run:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"[DRY RUN] Would create: {recurring.type} - "
-                            f"{recurring.amount} for {recurring.category} "
-                            f"via {recurring.account.name}"
-                        )
-                    )
-                else:
-                    # Create the actual transaction
-                    Transaction.objects.create(
-                        user=recurring.user,
-                        account=recurring.account,
-                        category=recurring.category,
-                        type=recurring.type,
-                        amount=recurring.amount,
-                        description=f"{recurring.description or ''} (Auto-generated from recurring transaction)".strip(),
-                        date=today
+        new_transactions = []
+        processed_recurring = []
+
+        # Stream rows (server-side cursor on PostgreSQL) and save in batches
+        for recurring in recurring_transactions.iterator(chunk_size=500):
+            if dry_run:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"[DRY RUN] Would create: {recurring.type} - "
+                        f"{recurring.amount} for {recurring.category} "
+                        f"via {recurring.account.name}"
                     )
+                )
+            else:
+                # Queue the actual transaction; saved in bulk below
+                new_transactions.append(Transaction(
+                    user_id=recurring.user_id,
+                    account_id=recurring.account_id,
+                    category_id=recurring.category_id,
+                    type=recurring.type,
+                    amount=recurring.amount,
+                    description=f"{recurring.description or ''} (Auto-generated from recurring transaction)".strip(),
+                    date=today
+                ))
 
-                    # Update last_processed_date
-                    recurring.last_processed_date = today
-                    recurring.save()
+                # Update last_processed_date
+                recurring.last_processed_date = today
+                processed_recurring.append(recurring)
 
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"Created: {recurring.type} - {recurring.amount} for "
-                            f"{recurring.category} via {recurring.account.name}"
-                        )
-                    )
+                if len(new_transactions) >= BATCH_SIZE:
+                    self.save_processed(new_transactions, processed_recurring)
+                    new_transactions = []
+                    processed_recurring = []
 
-                processed_count += 1
-            else:
-                skipped_count += 1
+            processed_count += 1
+
+        if new_transactions:
+            self.save_processed(new_transactions, processed_recurring)
+
+        skipped_count = active_recurring.count() - processed_count
 
         if dry_run:
             self.stdout.write(
@@ -86,29 +107,34 @@ class Command(BaseCommand):
                 )
             )
 
-    def should_process_today(self, recurring, today):
+    def save_processed(self, new_transactions, processed_recurring):
         """
-        Determine if a recurring transaction should be processed today
-        based on its frequency and last_processed_date
+        Insert the generated transactions and mark their recurring templates
+        processed in one database transaction.
+        bulk_create skips the Transaction signals, so balance and budget updates
+        are applied explicitly for the whole batch.
         """
-        # If never processed and today >= start_date, process it
-        if not recurring.last_processed_date:
-            return today >= recurring.start_date
-
-        # Calculate the next due date based on frequency
-        last_processed = recurring.last_processed_date
-
-        if recurring.frequency == "daily":
-            next_due = last_processed + timedelta(days=1)
-        elif recurring.frequency == "weekly":
-            next_due = last_processed + timedelta(weeks=1)
-        elif recurring.frequency == "monthly":
-            # Add one month (approximately 30 days, can be refined)
-            next_due = last_processed + timedelta(days=30)
-        elif recurring.frequency == "yearly":
-            next_due = last_processed + timedelta(days=365)
-        else:
-            return False
+        with transaction.atomic():
+            Transaction.objects.bulk_create(new_transactions, batch_size=BATCH_SIZE)
+            RecurringTransaction.objects.bulk_update(
+                processed_recurring, ['last_processed_date'], batch_size=BATCH_SIZE
+            )
+            apply_bulk_created_transactions(new_transactions)
+
+        for recurring in processed_recurring:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Created: {recurring.type} - {recurring.amount} for "
+                    f"{recurring.category} via {recurring.account.name}"
+                )
+            )
 
-        # Process if today is on or after the next due date
-        return today >= next_due
+    def due_filter(self, today):
+        """
+        Q matching recurring transactions due today: never processed, or at
+        least one frequency interval since last_processed_date
+        """
+        due = models.Q(last_processed_date__isnull=True)
+        for frequency, interval in FREQUENCY_INTERVALS.items():
+            due |= models.Q(frequency=frequency, last_processed_date__lte=today - interval)
+        return due
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('categories', '0003_category_category_user_created_idx'),
+        ('transactions', '0004_transaction_tx_user_type_date_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'account', 'date'], name='tx_user_account_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'category', 'type', 'date'], include=('amount',), name='tx_user_category_type_date_idx'),
+        ),
+    ]
@@ -25,6 +25,19 @@ class Transaction(models.Model):
     date = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "type", "date"], name="tx_user_type_date_idx"),
+            models.Index(fields=["user", "date"], name="tx_user_date_idx"),
+            models.Index(fields=["user", "account", "date"], name="tx_user_account_date_idx"),
+            # Covers budget expense sums: amount is included for index-only scans on PostgreSQL
+            models.Index(
+                fields=["user", "category", "type", "date"],
+                name="tx_user_category_type_date_idx",
+                include=["amount"],
+            ),
+        ]
+
     def __str__(self):
         return f"{self.type.title()} - {self.amount} ({self.category}) via {self.account.name}"
 
@@ -25,6 +25,54 @@ class TransactionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "user", "created_at", "category_name", "account_name"]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the account and category names read by the serializer"""
+        return queryset.select_related("account", "category").only(
+            "id", "user_id", "account__id", "account__name", "category__id",
+            "category__name", "type", "amount", "description", "date", "created_at",
+        )
+
+    # Columns read by values_representation()
+    values_fields = (
+        "id", "user", "account", "account__name", "category",
+        "category__name", "type", "amount", "description", "date", "created_at",
+    )
+
+    @classmethod
+    def values_representation(cls, rows):
+        """
+        Read-only fast path for list responses: render rows fetched with
+        values(*values_fields) instead of building a model instance per
+        transaction. Output matches to_representation().
+        """
+        fields = cls().fields
+        amount = fields["amount"].to_representation
+        date = fields["date"].to_representation
+        created_at = fields["created_at"].to_representation
+
+        data = []
+        for row in rows:
+            item = {
+                "id": row["id"],
+                "user": row["user"],
+                "account": row["account"],
+                "account_name": row["account__name"],
+                "category": row["category"],
+            }
+            # Like the serializer, leave category_name out when there is no category
+            if row["category"] is not None:
+                item["category_name"] = row["category__name"]
+            item.update(
+                type=row["type"],
+                amount=amount(row["amount"]),
+                description=row["description"],
+                date=date(row["date"]),
+                created_at=created_at(row["created_at"]),
+            )
+            data.append(item)
+        return data
+
 
 class RecurringTransactionSerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source="category.name", read_only=True)
@@ -50,3 +98,12 @@ class RecurringTransactionSerializer(serializers.ModelSerializer):
             "last_processed_date",
         ]
         read_only_fields = ["id", "user", "category_name", "account_name", "last_processed_date"]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the account and category names read by the serializer"""
+        return queryset.select_related("account", "category").only(
+            "id", "user_id", "account__id", "account__name", "category__id",
+            "category__name", "type", "amount", "description", "frequency",
+            "start_date", "end_date", "last_processed_date",
+        )
@@ -1,165 +1,228 @@
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
-from django.db.models import Sum
+from django.db import transaction as db_transaction
+from django.db.models import DecimalField, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from collections import defaultdict
 from decimal import Decimal
 import logging
 from .models import Transaction
 from apps.budgets.models import Budget
 from apps.accounts.models import Account
+from eta_api.utils.cache import invalidate_user_cache
 
 logger = logging.getLogger(__name__)
 
 
-# Store old transaction values before update
-_transaction_old_values = {}
-
-
 @receiver(pre_save, sender=Transaction)
 def store_old_transaction_values(sender, instance, **kwargs):
     """Store old transaction values before update to properly handle balance changes"""
     if instance.pk:  # Only for updates, not new transactions
-        try:
-            old_transaction = Transaction.objects.get(pk=instance.pk)
-            _transaction_old_values[instance.pk] = {
-                'amount': old_transaction.amount,
-                'type': old_transaction.type,
-                'account_id': old_transaction.account_id,
-                'category_id': old_transaction.category_id,
-                'date': old_transaction.date
-            }
-        except Transaction.DoesNotExist:
-            pass
+        # Kept on the instance itself, so it goes away with it. A named row
+        # (None if the row is gone) skips building a model instance.
+        instance._old_values = Transaction.objects.filter(pk=instance.pk).values_list(
+            'amount', 'type', 'account_id', 'category_id', 'date', named=True
+        ).first()
 
 
 @receiver(post_save, sender=Transaction)
 def handle_transaction_save(sender, instance, created, **kwargs):
     """Handle account balance and budget updates for transaction create/update"""
     try:
-        if created:
-            logger.info(f"NEW Transaction created: {instance.type} - {instance.amount} for category {instance.category}")
-
-            # NEW TRANSACTION: Just add the amount to account balance
-            account = instance.account
-            old_balance = account.balance
-            if instance.type == "income":
-                account.balance += instance.amount
-            elif instance.type == "expense":
-                account.balance -= instance.amount
-            account.save()
-            logger.info(f"Account {account.name} balance updated from {old_balance} to {account.balance}")
-
-            # Update budget for new expense
-            if instance.type == "expense" and instance.category:
-                logger.info(f"Updating budgets for category {instance.category}")
-                update_budgets_for_transaction(instance)
-
-        else:
-            # UPDATE TRANSACTION: Revert old, apply new
-            if instance.pk in _transaction_old_values:
-                old_values = _transaction_old_values[instance.pk]
-
-                # Revert old transaction from old account
-                old_account = Account.objects.get(pk=old_values['account_id'])
-                if old_values['type'] == "income":
-                    old_account.balance -= old_values['amount']
-                elif old_values['type'] == "expense":
-                    old_account.balance += old_values['amount']
-                old_account.save()
-
-                # Apply new transaction to new/same account
-                account = instance.account
-                if instance.type == "income":
-                    account.balance += instance.amount
-                elif instance.type == "expense":
-                    account.balance -= instance.amount
-                account.save()
-
-                # Update budgets if this affects expenses
-                if old_values['type'] == 'expense':
-                    # Recalculate old category budgets
-                    old_budgets = Budget.objects.filter(
-                        user=instance.user,
-                        category_id=old_values['category_id'],
-                        start_date__lte=old_values['date'],
-                        end_date__gte=old_values['date']
-                    )
-                    for budget in old_budgets:
-                        recalculate_budget_expense(budget)
+        with db_transaction.atomic():
+            _apply_transaction_save(instance, created)
+    except Exception as e:
+        logger.error(f"Error in handle_transaction_save: {str(e)}", exc_info=True)
 
-                if instance.type == "expense" and instance.category:
-                    update_budgets_for_transaction(instance)
 
-                # Clean up stored values
-                del _transaction_old_values[instance.pk]
+def _apply_transaction_save(instance, created):
+    if created:
+        logger.info(f"NEW Transaction created: {instance.type} - {instance.amount} for category {instance.category}")
 
-    except Exception as e:
-        logger.error(f"Error in handle_transaction_save: {str(e)}", exc_info=True)
+        # NEW TRANSACTION: Just add the amount to account balance
+        adjust_account_balance(
+            instance.user_id, instance.account_id, balance_delta(instance.type, instance.amount)
+        )
+        logger.info(f"Account {instance.account_id} balance adjusted for {instance.type} of {instance.amount}")
+
+        # Update budget for new expense
+        if instance.type == "expense" and instance.category_id:
+            logger.info(f"Updating budgets for category {instance.category}")
+            adjust_budget_expenses(instance.user_id, instance.category_id, instance.date, instance.amount)
+
+    else:
+        # UPDATE TRANSACTION: Revert old, apply new
+        old_values = getattr(instance, '_old_values', None)
+        if old_values is not None:
+            # Nothing to do when only non-financial fields (e.g. description) changed
+            if all(
+                getattr(old_values, field) == getattr(instance, field)
+                for field in ('amount', 'type', 'account_id', 'category_id', 'date')
+            ):
+                return
+
+            old_delta = balance_delta(old_values.type, old_values.amount)
+            new_delta = balance_delta(instance.type, instance.amount)
+            if old_values.account_id == instance.account_id:
+                # Same account: apply the net change in one UPDATE
+                adjust_account_balance(instance.user_id, instance.account_id, new_delta - old_delta)
+            else:
+                # Revert old transaction from old account, apply it to the new one
+                adjust_account_balance(instance.user_id, old_values.account_id, -old_delta)
+                adjust_account_balance(instance.user_id, instance.account_id, new_delta)
+
+            # Update budgets if this affects expenses
+            was_budgeted = old_values.type == 'expense' and old_values.category_id
+            is_budgeted = instance.type == "expense" and instance.category_id
+            if (
+                was_budgeted and is_budgeted
+                and old_values.category_id == instance.category_id
+                and old_values.date == instance.date
+            ):
+                # Same budgets before and after: apply the amount change once
+                adjust_budget_expenses(
+                    instance.user_id, instance.category_id, instance.date,
+                    instance.amount - old_values.amount
+                )
+            else:
+                # Take the old amount off the old budgets, add the new one to the new
+                if was_budgeted:
+                    adjust_budget_expenses(
+                        instance.user_id, old_values.category_id, old_values.date, -old_values.amount
+                    )
+                if is_budgeted:
+                    adjust_budget_expenses(
+                        instance.user_id, instance.category_id, instance.date, instance.amount
+                    )
 
 
 @receiver(post_delete, sender=Transaction)
 def handle_transaction_delete(sender, instance, **kwargs):
     """Update budget current_expense and account balance when transaction is deleted"""
-
-    # Revert the transaction from account balance
-    account = instance.account
-    if instance.type == "income":
-        account.balance -= instance.amount
-    elif instance.type == "expense":
-        account.balance += instance.amount
-    account.save()
-
-    # Update budget if this was an expense transaction
-    if instance.type == "expense" and instance.category:
-        budgets = Budget.objects.filter(
-            user=instance.user,
-            category=instance.category,
-            start_date__lte=instance.date,
-            end_date__gte=instance.date
+    with db_transaction.atomic():
+        # Revert the transaction from account balance
+        adjust_account_balance(
+            instance.user_id, instance.account_id, -balance_delta(instance.type, instance.amount)
         )
 
-        for budget in budgets:
-            recalculate_budget_expense(budget)
-
-
-def update_budgets_for_transaction(transaction):
-    """Update all budgets affected by this transaction"""
+        # Update budget if this was an expense transaction
+        if instance.type == "expense" and instance.category_id:
+            adjust_budget_expenses(instance.user_id, instance.category_id, instance.date, -instance.amount)
+
+
+@receiver(post_save, sender=Budget)
+def initialize_budget_expense(sender, instance, **kwargs):
+    """
+    Compute current_expense from existing transactions whenever a budget is
+    saved, since transaction writes only apply deltas to it
+    """
+    recalculate_budget_expenses(Budget.objects.filter(pk=instance.pk))
+    instance.refresh_from_db(fields=["current_expense"])
+
+
+def balance_delta(transaction_type, amount):
+    """Signed effect of a transaction on its account balance"""
+    if transaction_type == "income":
+        return amount
+    if transaction_type == "expense":
+        return -amount
+    return Decimal('0')
+
+
+def adjust_account_balance(user_id, account_id, delta):
+    """
+    Add delta to an account balance in a single UPDATE, so concurrent writes
+    cannot lose an update
+    """
+    if not delta:
+        return
+
+    Account.objects.filter(pk=account_id).update(balance=F("balance") + delta)
+    # update() skips the Account post_save handler that drops the cached list
+    invalidate_user_cache(user_id, "accounts")
+
+
+def adjust_budget_expenses(user_id, category_id, date, amount):
+    """
+    Add an expense amount to current_expense of every budget for the category
+    that covers the date, in a single UPDATE. Pass a negative amount to revert.
+    Full recalculation is left to budget saves and the recalculate_budgets command.
+    """
     try:
         budgets = Budget.objects.filter(
-            user=transaction.user,
-            category=transaction.category,
-            start_date__lte=transaction.date,
-            end_date__gte=transaction.date
+            user_id=user_id,
+            category_id=category_id,
+            start_date__lte=date,
+            end_date__gte=date
         )
 
-        logger.info(f"Found {budgets.count()} budgets to update for transaction")
-
-        for budget in budgets:
-            recalculate_budget_expense(budget)
+        updated = budgets.update(current_expense=F("current_expense") + amount)
+        logger.info(f"Updated {updated} budgets for transaction")
 
     except Exception as e:
-        logger.error(f"Error in update_budgets_for_transaction: {str(e)}", exc_info=True)
+        logger.error(f"Error in adjust_budget_expenses: {str(e)}", exc_info=True)
 
 
-def recalculate_budget_expense(budget):
-    """Recalculate the current_expense for a budget"""
+def recalculate_budget_expenses(budgets):
+    """
+    Recalculate current_expense for every budget in the queryset with a
+    single UPDATE, summing each budget's expenses in a correlated subquery
+    """
     try:
-        old_expense = budget.current_expense
-
         total_expense = Transaction.objects.filter(
-            user=budget.user,
-            category=budget.category,
+            user=OuterRef("user"),
+            category=OuterRef("category"),
             type="expense",
-            date__gte=budget.start_date,
-            date__lte=budget.end_date
-        ).aggregate(total=Sum("amount"))["total"] or Decimal('0')
+            date__gte=OuterRef("start_date"),
+            date__lte=OuterRef("end_date")
+        ).values("category").annotate(total=Sum("amount")).values("total")
 
-        budget.current_expense = total_expense
-        budget.save()
+        updated = budgets.update(current_expense=Coalesce(
+            Subquery(total_expense), Value(Decimal('0')), output_field=DecimalField()
+        ))
 
-        logger.info(
-            f"Budget {budget.id} (category: {budget.category}) "
-            f"current_expense updated from {old_expense} to {total_expense}"
-        )
+        logger.info(f"Recalculated current_expense for {updated} budgets")
 
     except Exception as e:
-        logger.error(f"Error in recalculate_budget_expense: {str(e)}", exc_info=True)
+        logger.error(f"Error in recalculate_budget_expenses: {str(e)}", exc_info=True)
+
+
+def apply_bulk_created_transactions(transactions):
+    """
+    Apply account balance and budget updates for transactions saved with
+    bulk_create, which skips the post_save handler above.
+    Balances get one UPDATE per account; budgets overlapping each category's
+    range of expense dates are recalculated in one UPDATE.
+    """
+    balance_deltas = defaultdict(Decimal)
+    expense_dates = {}
+    user_ids = set()
+
+    for transaction in transactions:
+        user_ids.add(transaction.user_id)
+        balance_deltas[transaction.user_id, transaction.account_id] += balance_delta(
+            transaction.type, transaction.amount
+        )
+        if transaction.type == "expense" and transaction.category_id:
+            key = (transaction.user_id, transaction.category_id)
+            first, last = expense_dates.get(key, (transaction.date, transaction.date))
+            expense_dates[key] = (min(first, transaction.date), max(last, transaction.date))
+
+    for (user_id, account_id), delta in balance_deltas.items():
+        adjust_account_balance(user_id, account_id, delta)
+
+    # One clause per (user, category); recalculating a budget that falls in a
+    # gap between two dates is harmless since it is a full recompute
+    budget_filters = Q(pk__in=[])
+    for (user_id, category_id), (first, last) in expense_dates.items():
+        budget_filters |= Q(
+            user_id=user_id,
+            category_id=category_id,
+            start_date__lte=last,
+            end_date__gte=first
+        )
+    recalculate_budget_expenses(Budget.objects.filter(budget_filters))
+
+    # update() skips the post_save handlers that drop cached dashboard data
+    for user_id in user_ids:
+        invalidate_user_cache(user_id, "analytics", "summary")
@@ -1,3 +1,220 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Q, Sum
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Account
+from apps.budgets.models import Budget
+from apps.categories.models import Category
+from .models import Transaction
+from .signals import apply_bulk_created_transactions
+
+User = get_user_model()
+
+
+class TransactionSignalTests(TestCase):
+    """
+    Account balances and budget current_expense are maintained with deltas by
+    the transaction signals; after every change they must equal a full recompute.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="signals@example.com", name="Signals", password="password123"
+        )
+        self.savings = Account.objects.create(
+            user=self.user, name="Savings", account_type="savings", balance=Decimal("1000")
+        )
+        self.cash = Account.objects.create(
+            user=self.user, name="Cash", account_type="cash", balance=Decimal("200")
+        )
+        self.opening_balances = {self.savings.pk: Decimal("1000"), self.cash.pk: Decimal("200")}
+
+        self.groceries = Category.objects.create(user=self.user, name="Groceries", type="expense")
+        self.fun = Category.objects.create(user=self.user, name="Fun", type="expense")
+
+        self.january = Budget.objects.create(
+            user=self.user, category=self.groceries, amount=Decimal("500"),
+            start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
+        )
+        self.february = Budget.objects.create(
+            user=self.user, category=self.groceries, amount=Decimal("500"),
+            start_date=date(2025, 2, 1), end_date=date(2025, 2, 28)
+        )
+        self.fun_january = Budget.objects.create(
+            user=self.user, category=self.fun, amount=Decimal("100"),
+            start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
+        )
+
+    def create_transaction(self, **kwargs):
+        values = {
+            "user": self.user,
+            "account": self.savings,
+            "category": self.groceries,
+            "type": "expense",
+            "amount": Decimal("50"),
+            "date": date(2025, 1, 15),
+        }
+        values.update(kwargs)
+        return Transaction.objects.create(**values)
+
+    def assertMatchesRecompute(self):
+        for account in Account.objects.filter(user=self.user):
+            totals = Transaction.objects.filter(account=account).aggregate(
+                income=Sum("amount", filter=Q(type="income")),
+                expense=Sum("amount", filter=Q(type="expense")),
+            )
+            expected = (
+                self.opening_balances[account.pk]
+                + (totals["income"] or 0)
+                - (totals["expense"] or 0)
+            )
+            self.assertEqual(account.balance, expected, f"balance of {account.name}")
+
+        for budget in Budget.objects.filter(user=self.user):
+            expected = Transaction.objects.filter(
+                user=self.user,
+                category=budget.category_id,
+                type="expense",
+                date__gte=budget.start_date,
+                date__lte=budget.end_date,
+            ).aggregate(total=Sum("amount"))["total"] or 0
+            self.assertEqual(budget.current_expense, expected, f"current_expense of budget {budget.pk}")
+
+    def balance(self, account):
+        account.refresh_from_db(fields=["balance"])
+        return account.balance
+
+    def current_expense(self, budget):
+        budget.refresh_from_db(fields=["current_expense"])
+        return budget.current_expense
+
+    def test_create_expense(self):
+        self.create_transaction()
+
+        self.assertEqual(self.balance(self.savings), Decimal("950"))
+        self.assertEqual(self.current_expense(self.january), Decimal("50"))
+        self.assertMatchesRecompute()
+
+    def test_create_income(self):
+        self.create_transaction(type="income", category=None, amount=Decimal("300"))
+
+        self.assertEqual(self.balance(self.savings), Decimal("1300"))
+        self.assertEqual(self.current_expense(self.january), Decimal("0"))
+        self.assertMatchesRecompute()
+
+    def test_amount_patch(self):
+        transaction = self.create_transaction()
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.patch(
+            f"/api/transactions/trans/{transaction.pk}/", {"amount": "80.00"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.balance(self.savings), Decimal("920"))
+        self.assertEqual(self.current_expense(self.january), Decimal("80"))
+        self.assertMatchesRecompute()
+
+    def test_type_change(self):
+        transaction = self.create_transaction()
+
+        transaction.type = "income"
+        transaction.save()
+
+        self.assertEqual(self.balance(self.savings), Decimal("1050"))
+        self.assertEqual(self.current_expense(self.january), Decimal("0"))
+        self.assertMatchesRecompute()
+
+    def test_account_move(self):
+        transaction = self.create_transaction()
+
+        transaction.account = self.cash
+        transaction.save()
+
+        self.assertEqual(self.balance(self.savings), Decimal("1000"))
+        self.assertEqual(self.balance(self.cash), Decimal("150"))
+        self.assertEqual(self.current_expense(self.january), Decimal("50"))
+        self.assertMatchesRecompute()
+
+    def test_category_and_date_move(self):
+        transaction = self.create_transaction()
+
+        transaction.category = self.fun
+        transaction.save()
+        self.assertEqual(self.current_expense(self.january), Decimal("0"))
+        self.assertEqual(self.current_expense(self.fun_january), Decimal("50"))
+
+        transaction.category = self.groceries
+        transaction.date = date(2025, 2, 10)
+        transaction.save()
+        self.assertEqual(self.current_expense(self.fun_january), Decimal("0"))
+        self.assertEqual(self.current_expense(self.february), Decimal("50"))
+        self.assertMatchesRecompute()
+
+    def test_description_edit_skips_balance_and_budget_updates(self):
+        transaction = self.create_transaction()
+
+        transaction.description = "Weekly shop"
+        with CaptureQueriesContext(connection) as queries:
+            transaction.save()
+
+        updated_tables = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+            and (Account._meta.db_table in query["sql"] or Budget._meta.db_table in query["sql"])
+        ]
+        self.assertEqual(updated_tables, [])
+        self.assertMatchesRecompute()
+
+    def test_delete(self):
+        transaction = self.create_transaction()
+        self.create_transaction(amount=Decimal("20"))
+
+        transaction.delete()
+
+        self.assertEqual(self.balance(self.savings), Decimal("980"))
+        self.assertEqual(self.current_expense(self.january), Decimal("20"))
+        self.assertMatchesRecompute()
+
+    def test_budget_save_recomputes_existing_expenses(self):
+        self.create_transaction(date=date(2025, 3, 5))
+        self.create_transaction(date=date(2025, 3, 20), amount=Decimal("30"))
+
+        march = Budget.objects.create(
+            user=self.user, category=self.groceries, amount=Decimal("500"),
+            start_date=date(2025, 3, 1), end_date=date(2025, 3, 31)
+        )
+        self.assertEqual(march.current_expense, Decimal("80"))
+
+        march.end_date = date(2025, 3, 10)
+        march.save()
+        self.assertEqual(march.current_expense, Decimal("50"))
+        self.assertMatchesRecompute()
+
+    def test_bulk_create(self):
+        transactions = Transaction.objects.bulk_create([
+            Transaction(user=self.user, account=self.savings, category=self.groceries,
+                        type="expense", amount=Decimal("10"), date=date(2025, 1, 5)),
+            Transaction(user=self.user, account=self.savings, category=self.groceries,
+                        type="expense", amount=Decimal("15"), date=date(2025, 1, 25)),
+            Transaction(user=self.user, account=self.cash, category=self.fun,
+                        type="expense", amount=Decimal("40"), date=date(2025, 1, 10)),
+            Transaction(user=self.user, account=self.cash, category=None,
+                        type="income", amount=Decimal("100"), date=date(2025, 2, 1)),
+        ])
+
+        apply_bulk_created_transactions(transactions)
 
-# Create your tests here.
+        self.assertEqual(self.balance(self.savings), Decimal("975"))
+        self.assertEqual(self.balance(self.cash), Decimal("260"))
+        self.assertEqual(self.current_expense(self.january), Decimal("25"))
+        self.assertEqual(self.current_expense(self.fun_january), Decimal("40"))
+        self.assertEqual(self.current_expense(self.february), Decimal("0"))
+        self.assertMatchesRecompute()
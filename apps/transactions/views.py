@@ -1,128 +1,64 @@
-from rest_framework import viewsets, permissions, status
+import logging
+
+from rest_framework import viewsets, permissions
+from rest_framework.pagination import LimitOffsetPagination
 from .models import Transaction, RecurringTransaction
 from .serializers import TransactionSerializer, RecurringTransactionSerializer
-from eta_api.utils.responses import success_response, error_response
+from eta_api.mixins import StandardResponseMixin
+from eta_api.utils.responses import success_response, pagination_meta
+
+logger = logging.getLogger(__name__)
 
 
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(StandardResponseMixin, viewsets.ModelViewSet):
     serializer_class = TransactionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    create_message = "Transaction created successfully"
+    update_message = "Transaction updated successfully"
+    destroy_message = "Transaction deleted successfully"
+    # Opt-in: lists are paged only when ?limit= is given
+    pagination_class = LimitOffsetPagination
 
     def get_queryset(self):
-        return Transaction.objects.filter(user=self.request.user).order_by("-date")
+        queryset = Transaction.objects.filter(user=self.request.user).order_by("-date", "-id")
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-    # 👇 Override CRUD methods with custom responses
+    # Read-only fast path; the other CRUD actions come from StandardResponseMixin
     def list(self, request, *args, **kwargs):
-        print("TransactionViewSet initialized")
-
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
+        logger.debug("TransactionViewSet.list called")
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return success_response(serializer.data)
+        serializer_class = self.get_serializer_class()
+        rows = self.get_queryset().values(*serializer_class.values_fields)
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            self.perform_create(serializer)
+        page = self.paginate_queryset(rows)
+        if page is not None:
             return success_response(
-                serializer.data,
-                status=status.HTTP_201_CREATED,
-                message="Transaction created successfully",
+                serializer_class.values_representation(page),
+                meta=pagination_meta(self.paginator),
             )
-        return error_response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST,
-            message="Validation failed",
-        )
 
-    def update(self, request, *args, **kwargs):
-        partial = kwargs.pop("partial", False)
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        if serializer.is_valid():
-            self.perform_update(serializer)
-            return success_response(
-                serializer.data, message="Transaction updated successfully"
-            )
-        return error_response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST,
-            message="Validation failed",
+        return success_response(
+            serializer_class.values_representation(rows.iterator(chunk_size=2000))
         )
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        self.perform_destroy(instance)
-        return success_response(None, message="Transaction deleted successfully")
-
 
-class RecurringTransactionViewSet(viewsets.ModelViewSet):
+class RecurringTransactionViewSet(StandardResponseMixin, viewsets.ModelViewSet):
     serializer_class = RecurringTransactionSerializer
     permission_classes = [permissions.IsAuthenticated]
-
-    # print("RecurringTransactionViewSet initialized")
+    create_message = "Recurring transaction created successfully"
+    update_message = "Recurring transaction updated successfully"
+    destroy_message = "Recurring transaction deleted successfully"
+    # Opt-in: lists are paged only when ?limit= is given
+    pagination_class = LimitOffsetPagination
 
     def get_queryset(self):
-        return RecurringTransaction.objects.filter(user=self.request.user).order_by(
-            "-start_date"
+        queryset = RecurringTransaction.objects.filter(user=self.request.user).order_by(
+            "-start_date", "-id"
         )
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
-
-    # 👇 Override CRUD methods with custom responses
-    def list(self, request, *args, **kwargs):
-        print("RecurringTransactionViewSet initialized")
-
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(serializer.data)
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return success_response(serializer.data)
-
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            self.perform_create(serializer)
-            return success_response(
-                serializer.data,
-                status=status.HTTP_201_CREATED,
-                message="Recurring transaction created successfully",
-            )
-        return error_response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST,
-            message="Validation failed",
-        )
-
-    def update(self, request, *args, **kwargs):
-        partial = kwargs.pop("partial", False)
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        if serializer.is_valid():
-            self.perform_update(serializer)
-            return success_response(
-                serializer.data, message="Recurring transaction updated successfully"
-            )
-        return error_response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST,
-            message="Validation failed",
-        )
-
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        self.perform_destroy(instance)
-        return success_response(
-            None, message="Recurring transaction deleted successfully"
-        )
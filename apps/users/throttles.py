@@ -0,0 +1,9 @@
+from django.core.cache import caches
+from rest_framework.throttling import ScopedRateThrottle
+
+
+class LoginRateThrottle(ScopedRateThrottle):
+    """ScopedRateThrottle counting attempts in the "throttle" cache, which stays
+    enabled when the default cache is a DummyCache"""
+
+    cache = caches["throttle"]
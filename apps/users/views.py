@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User
 from .serializers import UserSerializer
+from .throttles import LoginRateThrottle
 
 
 class RegisterView(generics.CreateAPIView):
@@ -20,11 +21,16 @@ class RegisterView(generics.CreateAPIView):
 
 class LoginView(generics.GenericAPIView):
     serializer_class = UserSerializer
+    throttle_classes = [LoginRateThrottle]
+    throttle_scope = "login"
 
     def post(self, request, *args, **kwargs):
         email = request.data.get("email")
         password = request.data.get("password")
-        user = User.objects.filter(email=email).first()
+        # Only what the password check, token and response need
+        user = User.objects.only(
+            "password", "is_active", *UserSerializer.Meta.fields
+        ).filter(email=email).first()
         if user and user.check_password(password):
             refresh = RefreshToken.for_user(user)
             return Response(
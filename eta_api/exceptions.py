@@ -1,6 +1,6 @@
 from rest_framework.views import exception_handler
-from rest_framework.response import Response
 from rest_framework import status
+from eta_api.utils.responses import error_response
 
 
 def custom_exception_handler(exc, context):
@@ -8,11 +8,25 @@ def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
 
     if response is not None:
-        response.data["status_code"] = response.status_code
-        return response
+        # Validation errors carry field errors (dict or list); others a "detail"
+        errors = response.data
+        if isinstance(errors, dict) and "detail" in errors:
+            message = str(errors["detail"])
+        else:
+            message = "Validation failed"
+
+        wrapped = error_response(errors=errors, message=message, status=response.status_code)
+        wrapped.data["status_code"] = response.status_code
+        # Keep headers set by DRF (WWW-Authenticate, Retry-After)
+        for header, value in response.items():
+            wrapped[header] = value
+        return wrapped
 
     # For non-DRF exceptions (e.g. Python errors)
-    return Response(
-        {"error": str(exc), "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR},
+    wrapped = error_response(
+        errors={"detail": str(exc)},
+        message="Internal server error",
         status=status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
+    wrapped.data["status_code"] = status.HTTP_500_INTERNAL_SERVER_ERROR
+    return wrapped
@@ -0,0 +1,102 @@
+from rest_framework import status
+from rest_framework.decorators import action
+from eta_api.utils.cache import invalidate_user_cache
+from eta_api.utils.responses import success_response, error_response, pagination_meta
+
+
+class StandardResponseMixin:
+    """
+    ModelViewSet CRUD actions answering in the success_response/error_response
+    envelope. Set the *_message attributes for resource-specific messages.
+    list() pages with the viewset's paginator when it returns a page.
+    """
+
+    create_message = "Created successfully"
+    update_message = "Updated successfully"
+    destroy_message = "Deleted successfully"
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return success_response(serializer.data, meta=pagination_meta(self.paginator))
+
+        serializer = self.get_serializer(queryset, many=True)
+        return success_response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        return success_response(serializer.data)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if serializer.is_valid():
+            self.perform_create(serializer)
+            return success_response(
+                serializer.data,
+                status=status.HTTP_201_CREATED,
+                message=self.create_message,
+            )
+        return error_response(
+            serializer.errors,
+            status=status.HTTP_400_BAD_REQUEST,
+            message="Validation failed",
+        )
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        if serializer.is_valid():
+            self.perform_update(serializer)
+            return success_response(serializer.data, message=self.update_message)
+        return error_response(
+            serializer.errors,
+            status=status.HTTP_400_BAD_REQUEST,
+            message="Validation failed",
+        )
+
+    def destroy(self, request, *args, **kwargs):
+        instance = self.get_object()
+        self.perform_destroy(instance)
+        return success_response(None, message=self.destroy_message)
+
+
+class BulkCreateMixin:
+    """
+    Adds POST {prefix}/bulk/ accepting a list of objects, saved with one
+    bulk_create per batch instead of one INSERT per row.
+    Note: bulk_create skips model save() and pre/post_save signals, so the
+    user's cached dashboard data is invalidated here instead.
+    """
+
+    bulk_create_batch_size = 1000
+    bulk_create_message = "Records created successfully"
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            return error_response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST,
+                message="Validation failed",
+            )
+
+        model = self.get_serializer_class().Meta.model
+        objects = self.perform_bulk_create(
+            [model(user=request.user, **item) for item in serializer.validated_data]
+        )
+        invalidate_user_cache(request.user.pk, "analytics", "summary")
+        return success_response(
+            self.get_serializer(objects, many=True).data,
+            status=status.HTTP_201_CREATED,
+            message=self.bulk_create_message,
+        )
+
+    def perform_bulk_create(self, objects):
+        model = self.get_serializer_class().Meta.model
+        return model.objects.bulk_create(objects, batch_size=self.bulk_create_batch_size)
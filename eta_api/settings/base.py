@@ -71,6 +71,10 @@ REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
     ],
+    "DEFAULT_THROTTLE_RATES": {
+        # Login attempts per client IP; each attempt costs a password hash
+        "login": os.getenv("LOGIN_THROTTLE_RATE", "10/min"),
+    },
 }
 
 
@@ -112,6 +116,48 @@ TEMPLATES = [
 WSGI_APPLICATION = "eta_api.wsgi.application"
 
 
+# Cache
+# Redis when REDIS_URL is set. Cached data is invalidated by bumping per-user
+# version keys, which only works when every worker (and cron command) shares
+# the cache, so without Redis caching is disabled (DummyCache).
+# Redis errors are ignored so an outage falls back to recomputing.
+# The "throttle" cache keeps rate-limit counters, per process without Redis.
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    REDIS_CACHE = {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    }
+    CACHES = {
+        "default": REDIS_CACHE,
+        "throttle": REDIS_CACHE,
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        },
+        "throttle": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
+# Seconds cached account/category lists are kept (invalidated on write)
+LIST_CACHE_TTL = int(os.getenv("LIST_CACHE_TTL", 3600))
+
+# Seconds dashboard analytics results are kept (invalidated on write)
+ANALYTICS_CACHE_TTL = int(os.getenv("ANALYTICS_CACHE_TTL", 300))
+
+# Seconds dashboard summary payloads are kept (invalidated on write)
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", 60))
+
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
@@ -168,5 +214,29 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Logging: app loggers write to stderr (level via LOG_LEVEL)
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "verbose": {
+            "format": "{asctime} {levelname} {name} {message}",
+            "style": "{",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "verbose",
+        },
+    },
+    "loggers": {
+        "apps": {
+            "handlers": ["console"],
+            "level": os.getenv("LOG_LEVEL", "WARNING"),
+        },
+    },
+}
+
 # API key
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
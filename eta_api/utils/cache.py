@@ -0,0 +1,58 @@
+# utils/cache.py
+import hashlib
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+
+
+def _version_key(namespace, user_id):
+    return f"cache-version:{namespace}:{user_id}"
+
+
+def user_cache_key(namespace, user_id, *parts):
+    """
+    Build a cache key for one user's data in `namespace`.
+    The key embeds the namespace's current version, so invalidation never
+    has to find or delete the individual keys.
+    """
+    version = cache.get_or_set(_version_key(namespace, user_id), time.time_ns, timeout=None)
+    return ":".join(str(part) for part in (namespace, user_id, version, *parts))
+
+
+def invalidate_user_cache(user_id, *namespaces):
+    """Make every cached entry for the user in the given namespaces unreachable."""
+    for namespace in namespaces:
+        cache.set(_version_key(namespace, user_id), time.time_ns(), timeout=None)
+
+
+def params_hash(params):
+    """
+    Short, fixed-length key part for (name, value) pairs such as query params,
+    so arbitrary user input cannot produce long or odd cache keys
+    """
+    query = urlencode(sorted((str(key), str(value)) for key, value in params))
+    return hashlib.md5(query.encode()).hexdigest()
+
+
+def get_or_set_for_user(namespace, user_id, compute, timeout, *parts):
+    """Return the cached value for the user, computing and storing it on a miss."""
+    return cache.get_or_set(user_cache_key(namespace, user_id, *parts), compute, timeout)
+
+
+def cached_per_user(namespace, timeout):
+    """
+    Cache the result of `func(user, *args, **kwargs)` per user and argument values.
+    Cached results are dropped with invalidate_user_cache(user_id, namespace).
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(user, *args, **kwargs):
+            params = [*enumerate(args), *kwargs.items()]
+            return get_or_set_for_user(
+                namespace, user.pk, lambda: func(user, *args, **kwargs), timeout,
+                func.__name__, params_hash(params)
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,8 @@
+# utils/dates.py
+from datetime import date
+
+
+def add_months(month_start, months):
+    """Return the first day of the calendar month `months` away from `month_start`"""
+    month_index = month_start.year * 12 + month_start.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
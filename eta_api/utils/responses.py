@@ -23,6 +23,18 @@ def success_response(data=None, message="Request successful", status=200, meta=N
     return Response(response, status=status)
 
 
+def pagination_meta(paginator):
+    """
+    Metadata for a page returned by a DRF paginator, to pass as
+    success_response(meta=...).
+    """
+    return {
+        "count": paginator.count,
+        "next": paginator.get_next_link(),
+        "previous": paginator.get_previous_link(),
+    }
+
+
 def error_response(errors=None, message="Something went wrong", status=400, data=None):
     """
     Standard error response.
@@ -0,0 +1,14 @@
+# utils/serializers.py
+
+
+def format_decimals(rows, fields):
+    """
+    Format Decimal columns of `.values()` rows the way DRF's DecimalField does
+    (fixed two places, as strings), so the fast read path matches serializer output.
+    """
+    rows = list(rows)
+    for row in rows:
+        for field in fields:
+            if row[field] is not None:
+                row[field] = f"{row[field]:.2f}"
+    return rows